@@ -15,10 +15,30 @@ class Settings(BaseSettings):
     # OpenAI Configuration
     OPENAI_API_KEY: str
     OPENAI_MODEL: str = "gpt-4o-2024-08-06"
+    # Connection pool and timeouts for the shared OpenAI HTTP client
+    OPENAI_MAX_CONNECTIONS: int = 1000
+    OPENAI_MAX_KEEPALIVE: int = 200
+    OPENAI_TIMEOUT: float = 30.0
+    OPENAI_CONNECT_TIMEOUT: float = 5.0
+    # Post intent requests as pre-encoded JSON straight to the REST endpoint,
+    # skipping the SDK's per-call request building (opt-in)
+    OPENAI_FAST_PATH: bool = False
+    # Output cap for intent parsing (tool-call JSON and clarifications are short)
+    OPENAI_MAX_TOKENS: int = 256
+    # Messages longer than this are rejected before calling OpenAI
+    MAX_INTENT_CHARS: int = 1000
+    # In-process cache of parsed intents for repeated canonical phrases
+    INTENT_CACHE_TTL: float = 300.0
+    INTENT_CACHE_MAX_SIZE: int = 2048
+    # Max in-flight requests for OpenAIService.parse_intents_batch
+    OPENAI_BATCH_CONCURRENCY: int = 50
 
     # Sui Blockchain Configuration
     SUI_NETWORK: Literal["mainnet", "testnet", "devnet", "localnet"] = "testnet"
     SUI_RPC_URL: str = "https://fullnode.testnet.sui.io:443"
+    # Pooled HTTP client settings for outbound RPC (see services/http_pool.py)
+    SUI_RPC_POOL_PER_HOST: int = 32
+    SUI_RPC_REQUEST_TIMEOUT: float = 10.0
 
     # Stake Contract Configuration (uses same package as address_book)
     STAKE_PACKAGE_ID: str = "0x8e385abb2ccefc0aed625567e72c8005f06ae3a97d534a25cb8e5dd2b62f6f9c"
@@ -29,19 +49,37 @@ class Settings(BaseSettings):
     # Address Book Contract Configuration (On-Chain Contact Storage)
     ADDRESS_BOOK_PACKAGE_ID: str = "0x8e385abb2ccefc0aed625567e72c8005f06ae3a97d534a25cb8e5dd2b62f6f9c"
     ADDRESS_BOOK_MODULE: str = "address_book"
+    # In-process cache for /contacts/address-book/info lookups
+    ADDRESS_BOOK_CACHE_TTL: float = 30.0
+    ADDRESS_BOOK_CACHE_MAX_SIZE: int = 10_000
 
     # Walrus Storage Configuration
     WALRUS_PUBLISHER_URL: str = "https://publisher.walrus-testnet.walrus.space"
     WALRUS_AGGREGATOR_URL: str = "https://aggregator.walrus-testnet.walrus.space"
+    # Shared HTTP/2 client pool for publisher/aggregator requests
+    WALRUS_MAX_CONNECTIONS: int = 100
+    WALRUS_MAX_KEEPALIVE: int = 20
 
     # Application Configuration
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     DEBUG: bool = True
     LOG_LEVEL: str = "INFO"
+    # Max worker threads for blocking calls offloaded from async handlers
+    THREAD_POOL_SIZE: int = 100
+    # Gunicorn worker processes in production (0 = 2 * CPU cores + 1)
+    WEB_CONCURRENCY: int = 0
 
     # Security
     SECRET_KEY: str
+    # KDF for Seal contact keys: "blake2b" (keyed hash, fast) or "pbkdf2"
+    # (100k iterations). Data encrypted under PBKDF2 still decrypts with blake2b.
+    SEAL_KDF: Literal["blake2b", "pbkdf2"] = "blake2b"
+    # In-process cache of per-user Seal ciphers (derived key + Fernet instance)
+    SEAL_KEY_CACHE_TTL: float = 300.0
+    SEAL_KEY_CACHE_MAX_SIZE: int = 1024
+    # Seconds browsers may cache CORS preflight (OPTIONS) responses
+    CORS_MAX_AGE: int = 86400
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration - the single production server policy
+
+Used by both the Dockerfile CMD and `python main.py` with DEBUG=False, so
+worker count and timeouts can't drift between the two. Only config is
+imported here: the app itself ("main:app") is loaded in each worker after
+the fork.
+"""
+
+import os
+import sys
+
+# The gunicorn executable doesn't put the app directory on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import settings
+
+bind = f"{settings.API_HOST}:{settings.API_PORT}"
+# WEB_CONCURRENCY=0 sizes the pool from the CPU count
+workers = settings.WEB_CONCURRENCY or 2 * (os.cpu_count() or 1) + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 5
+timeout = 60
+loglevel = settings.LOG_LEVEL.lower()
@@ -7,21 +7,40 @@ Handles natural language blockchain interactions with privacy-first contact mana
 
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import sys
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+import anyio
+import orjson
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from config import settings
+from middleware import FastCORSMiddleware
 from routers import chat_router, contacts_router
+from services.http_pool import close_http_clients, get_async_client
+from services.openai_service import openai_service
+from services.walrus_service import walrus_service
+from utils import BufferedRotatingFileHandler, RateLimiter
 
 # Create logs directory if it doesn't exist
 LOGS_DIR = os.path.join(os.path.dirname(__file__), "logs")
 os.makedirs(LOGS_DIR, exist_ok=True)
 
+# Skip per-record bookkeeping our format never prints: caller frame lookup,
+# thread/process names (see "Optimization" in the logging HOWTO)
+logging._srcfile = None
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Configure logging with both console and file handlers
 log_level = getattr(logging, settings.LOG_LEVEL)
 log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+log_formatter = logging.Formatter(log_format)
 
 # Create root logger
 root_logger = logging.getLogger()
@@ -30,34 +49,83 @@ root_logger.setLevel(log_level)
 # Console handler
 console_handler = logging.StreamHandler()
 console_handler.setLevel(log_level)
-console_handler.setFormatter(logging.Formatter(log_format))
+console_handler.setFormatter(log_formatter)
 root_logger.addHandler(console_handler)
 
-# File handler with rotation (10MB max, keep 5 backups)
-file_handler = RotatingFileHandler(
+# File handler with rotation (10MB max, keep 5 backups), buffered writes
+# flushed every 30s and on ERROR+
+file_handler = BufferedRotatingFileHandler(
     os.path.join(LOGS_DIR, "app.log"),
     maxBytes=10*1024*1024,  # 10MB
     backupCount=5,
     encoding='utf-8'
 )
 file_handler.setLevel(log_level)
-file_handler.setFormatter(logging.Formatter(log_format))
-root_logger.addHandler(file_handler)
+file_handler.setFormatter(log_formatter)
 
 # Separate error log file
-error_file_handler = RotatingFileHandler(
+error_file_handler = BufferedRotatingFileHandler(
     os.path.join(LOGS_DIR, "error.log"),
     maxBytes=10*1024*1024,  # 10MB
     backupCount=5,
     encoding='utf-8'
 )
 error_file_handler.setLevel(logging.ERROR)
-error_file_handler.setFormatter(logging.Formatter(log_format))
-root_logger.addHandler(error_file_handler)
+error_file_handler.setFormatter(log_formatter)
+
+# File handlers run on a background thread fed by a queue, so request
+# coroutines only enqueue records and never block on disk writes/rotation.
+# The listener is started/stopped in the app lifespan.
+log_queue = queue.Queue(-1)
+root_logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(
+    log_queue,
+    file_handler,
+    error_file_handler,
+    respect_handler_level=True
+)
 
 logger = logging.getLogger(__name__)
 logger.info(f"Logging configured. Log files: {LOGS_DIR}")
 
+# ============================================================================
+# Lifespan (Startup & Shutdown)
+# ============================================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup and shutdown tasks
+    """
+    log_listener.start()
+    try:
+        logger.info("Starting Sui Blockchain AI Agent...")
+        logger.info(f"Environment: {settings.SUI_NETWORK}")
+        logger.info(f"Sui RPC: {settings.SUI_RPC_URL}")
+        logger.info(f"Walrus Publisher: {settings.WALRUS_PUBLISHER_URL}")
+        logger.info(f"OpenAI Model: {settings.OPENAI_MODEL}")
+
+        # Blocking service calls are offloaded to AnyIO's worker threads;
+        # raise the default limit of 40 so they don't queue under load
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = settings.THREAD_POOL_SIZE
+        logger.info(f"Worker thread pool size: {limiter.total_tokens}")
+
+        # Open the shared HTTP pool up front and expose it to request handlers
+        app.state.http_client = get_async_client()
+
+        logger.info("Application started successfully!")
+        yield
+    finally:
+        # Always release pooled connections and flush queued log records,
+        # even if startup failed halfway
+        logger.info("Shutting down Sui Blockchain AI Agent...")
+        await close_http_clients()
+        await openai_service.aclose()
+        await walrus_service.aclose()
+        log_listener.stop()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Sui Blockchain AI Agent",
@@ -74,12 +142,14 @@ app = FastAPI(
     """,
     version="1.0.0-mvp",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=[
         "http://localhost:3000",  # React dev server
         "http://localhost:5173",  # Vite dev server
@@ -92,88 +162,98 @@ app.add_middleware(
         "https://*.onrender.com",
     ],
     allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods
-    allow_headers=["*"],  # Allow all headers
+    # Explicit lists (not "*") keep the browser preflight cache key stable
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    max_age=settings.CORS_MAX_AGE,  # Let browsers cache preflight responses
 )
 
+# Compress larger JSON responses (chat replies, contact lists); small ones
+# aren't worth the CPU. Sets Vary: Accept-Encoding.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(chat_router)
 app.include_router(contacts_router)
 
 
 # ============================================================================
-# Startup & Shutdown Events
+# Root Endpoints
 # ============================================================================
 
-@app.on_event("startup")
-async def startup_event():
-    """
-    Application startup tasks
-    """
-    logger.info("Starting Sui Blockchain AI Agent...")
-    logger.info(f"Environment: {settings.SUI_NETWORK}")
-    logger.info(f"Sui RPC: {settings.SUI_RPC_URL}")
-    logger.info(f"Walrus Publisher: {settings.WALRUS_PUBLISHER_URL}")
-    logger.info(f"OpenAI Model: {settings.OPENAI_MODEL}")
-    logger.info("Application started successfully!")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Application shutdown tasks
-    """
-    logger.info("Shutting down Sui Blockchain AI Agent...")
+# Static payload, serialized once at import time
+ROOT_PAYLOAD = {
+    "service": "Sui Blockchain AI Agent",
+    "version": "1.0.0-mvp",
+    "status": "running",
+    "docs": "/docs",
+    "endpoints": {
+        "chat": "/api/v1/chat",
+        "execute": "/api/v1/execute",
+        "contacts_create_address_book": "/contacts/address-book/create",
+        "contacts_info": "/contacts/address-book/info",
+        "contacts_add": "/contacts/add",
+        "contacts_health": "/contacts/health",
+        "health": "/api/v1/health"
+    },
+    "features": [
+        "Natural language transaction parsing",
+        "OpenAI GPT-4 with strict mode",
+        "Privacy-first contact encryption (Seal)",
+        "On-chain contact storage",
+        "Sui blockchain integration"
+    ]
+}
+ROOT_JSON_BYTES = orjson.dumps(ROOT_PAYLOAD)
 
 
-# ============================================================================
-# Root Endpoints
-# ============================================================================
-
 @app.get("/")
 async def root():
     """
     Root endpoint with API information
     """
-    return {
-        "service": "Sui Blockchain AI Agent",
-        "version": "1.0.0-mvp",
-        "status": "running",
-        "docs": "/docs",
-        "endpoints": {
-            "chat": "/api/v1/chat",
-            "execute": "/api/v1/execute",
-            "contacts_create_address_book": "/contacts/address-book/create",
-            "contacts_info": "/contacts/address-book/info",
-            "contacts_add": "/contacts/add",
-            "contacts_health": "/contacts/health",
-            "health": "/api/v1/health"
-        },
-        "features": [
-            "Natural language transaction parsing",
-            "OpenAI GPT-4 with strict mode",
-            "Privacy-first contact encryption (Seal)",
-            "On-chain contact storage",
-            "Sui blockchain integration"
-        ]
-    }
+    return Response(content=ROOT_JSON_BYTES, media_type="application/json")
 
 
 # ============================================================================
 # Error Handlers
 # ============================================================================
 
+# Production 500 body never depends on the exception, so serialize it once.
+# A fresh Response is still built per error: middleware mutates its headers.
+ERROR_500_BODY = orjson.dumps({
+    "error": "Internal server error",
+    "detail": "An unexpected error occurred"
+})
+
+# Formatting tracebacks is expensive; during an error storm only log
+# a bounded number per second and count the rest
+traceback_limiter = RateLimiter(rate=10, per=1.0)
+suppressed_tracebacks = 0
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """
     Global exception handler for unhandled errors
     """
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    global suppressed_tracebacks
+    if traceback_limiter.try_acquire():
+        if suppressed_tracebacks:
+            logger.error(f"Suppressed {suppressed_tracebacks} unhandled exception tracebacks")
+            suppressed_tracebacks = 0
+        logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    else:
+        suppressed_tracebacks += 1
+
+    if not settings.DEBUG:
+        return Response(content=ERROR_500_BODY, status_code=500, media_type="application/json")
+
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "detail": str(exc) if settings.DEBUG else "An unexpected error occurred"
+            "detail": str(exc)
         }
     )
 
@@ -183,13 +263,36 @@ async def global_exception_handler(request, exc):
 # ============================================================================
 
 if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(
-        "main:app",
-        host=settings.API_HOST,
-        port=settings.API_PORT,
-        reload=settings.DEBUG,
-        reload_excludes=["logs/*", "*.log"] if settings.DEBUG else None,
-        log_level=settings.LOG_LEVEL.lower()
-    )
+    if settings.DEBUG or sys.platform == "win32":
+        # Single process with auto-reload for local development
+        # (Gunicorn does not run on Windows)
+        import uvicorn
+
+        uvicorn.run(
+            "main:app",
+            host=settings.API_HOST,
+            port=settings.API_PORT,
+            reload=settings.DEBUG,
+            reload_excludes=["logs/*", "*.log"] if settings.DEBUG else None,
+            log_level=settings.LOG_LEVEL.lower(),
+            # uvloop is not available on Windows, fall back to the stdlib loop there
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools"
+        )
+    else:
+        # Production: Gunicorn master with one Uvicorn worker per process.
+        # This process has already imported the whole app (module-level
+        # clients, logging threads, nonce seed), so it is replaced by a fresh
+        # Gunicorn master that imports "main:app" in each worker after the
+        # fork instead of handing every worker a copy of this state. Workers,
+        # bind and timeouts come from gunicorn.conf.py, as in the Dockerfile.
+        app_dir = os.path.dirname(os.path.abspath(__file__))
+        logger.info("Starting Gunicorn with Uvicorn workers")
+        # exec doesn't run atexit hooks: flush buffered log records first
+        logging.shutdown()
+
+        os.execv(sys.executable, [
+            sys.executable, "-m", "gunicorn", "main:app",
+            "--chdir", app_dir,
+            "--config", os.path.join(app_dir, "gunicorn.conf.py")
+        ])
@@ -0,0 +1,7 @@
+"""
+Middleware package for Sui Blockchain AI Agent
+"""
+
+from .fast_cors import FastCORSMiddleware
+
+__all__ = ["FastCORSMiddleware"]
@@ -0,0 +1,84 @@
+"""
+Fast CORS Middleware - CORSMiddleware with init-time lookup tables
+
+Starlette already joins the Allow-Methods/Allow-Headers/Max-Age strings once
+in __init__, but still checks origins and requested headers against plain
+lists on every request. This subclass freezes those lists into sets and
+memoizes the per-origin decision, so the hot path is a couple of dict/set
+lookups.
+"""
+
+import typing
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import ASGIApp
+
+# Upper bound for the per-origin decision cache (origins are client-controlled)
+MAX_CACHED_ORIGINS = 1024
+
+
+class FastCORSMiddleware(CORSMiddleware):
+    """
+    Drop-in replacement for Starlette's CORSMiddleware
+
+    Behaviour is identical; only the data structures used on the request
+    path differ.
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs: typing.Any) -> None:
+        super().__init__(app, **kwargs)
+        self._allow_origins_set = frozenset(self.allow_origins)
+        self._allow_methods_set = frozenset(self.allow_methods)
+        self._allow_headers_set = frozenset(self.allow_headers)
+        self._origin_cache: typing.Dict[str, bool] = {}
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        cached = self._origin_cache.get(origin)
+        if cached is not None:
+            return cached
+
+        if self.allow_all_origins or origin in self._allow_origins_set:
+            allowed = True
+        else:
+            allowed = (
+                self.allow_origin_regex is not None
+                and self.allow_origin_regex.fullmatch(origin) is not None
+            )
+
+        if len(self._origin_cache) < MAX_CACHED_ORIGINS:
+            self._origin_cache[origin] = allowed
+        return allowed
+
+    def preflight_response(self, request_headers: Headers) -> Response:
+        requested_origin = request_headers["origin"]
+        requested_method = request_headers["access-control-request-method"]
+        requested_headers = request_headers.get("access-control-request-headers")
+
+        headers = dict(self.preflight_headers)
+        failures = []
+
+        if self.is_allowed_origin(origin=requested_origin):
+            if self.preflight_explicit_allow_origin:
+                headers["Access-Control-Allow-Origin"] = requested_origin
+        else:
+            failures.append("origin")
+
+        if requested_method not in self._allow_methods_set:
+            failures.append("method")
+
+        # Mirror back requested headers when all headers are allowed
+        if self.allow_all_headers and requested_headers is not None:
+            headers["Access-Control-Allow-Headers"] = requested_headers
+        elif requested_headers is not None:
+            for header in requested_headers.lower().split(","):
+                if header.strip() not in self._allow_headers_set:
+                    failures.append("headers")
+                    break
+
+        if failures:
+            failure_text = "Disallowed CORS " + ", ".join(failures)
+            return PlainTextResponse(failure_text, status_code=400, headers=headers)
+
+        return PlainTextResponse("OK", status_code=200, headers=headers)
@@ -5,6 +5,10 @@ Models package for Sui Blockchain AI Agent
 from .schemas import (
     TokenType,
     IntentAction,
+    TokenLiteral,
+    IntentActionLiteral,
+    TOKEN_TYPE_BY_VALUE,
+    INTENT_ACTION_BY_VALUE,
     ChatRequest,
     ChatResponse,
     ExecuteTransactionRequest,
@@ -20,6 +24,10 @@ from .schemas import (
 __all__ = [
     "TokenType",
     "IntentAction",
+    "TokenLiteral",
+    "IntentActionLiteral",
+    "TOKEN_TYPE_BY_VALUE",
+    "INTENT_ACTION_BY_VALUE",
     "ChatRequest",
     "ChatResponse",
     "ExecuteTransactionRequest",
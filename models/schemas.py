@@ -3,11 +3,31 @@ Pydantic Models for Request/Response Handling
 Defines all data structures for the Sui Blockchain AI Agent API
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Literal, List, Dict, Any
 from enum import Enum
 
 
+# ============================================================================
+# Base Model
+# ============================================================================
+
+class FrozenModel(BaseModel):
+    """
+    Base for API models: immutable, no unknown fields, no assignment hooks
+
+    Subclasses may still declare their own model_config (e.g. json_schema_extra);
+    Pydantic merges it with this one.
+    """
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        str_strip_whitespace=False,
+        from_attributes=False
+    )
+
+
 # ============================================================================
 # Enums
 # ============================================================================
@@ -34,11 +54,35 @@ class IntentAction(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Model fields use Literal types instead of the enums: pydantic-core checks
+# them with a plain string membership test and stores the interned str.
+# Enum members are still accepted as input (they are str subclasses) and
+# compare equal to the stored values.
+TokenLiteral = Literal["SUI", "USDC"]
+IntentActionLiteral = Literal[
+    "transfer_token",
+    "resolve_contact",
+    "get_balance",
+    "stake_token",
+    "unstake_token",
+    "get_stake_info",
+    "create_address_book",
+    "save_contact",
+    "list_contacts",
+    "ambiguous",
+    "unknown"
+]
+
+# Value -> enum member lookups for code that needs the enum object
+TOKEN_TYPE_BY_VALUE: Dict[str, TokenType] = {t.value: t for t in TokenType}
+INTENT_ACTION_BY_VALUE: Dict[str, IntentAction] = {a.value: a for a in IntentAction}
+
+
 # ============================================================================
 # Request Models
 # ============================================================================
 
-class ChatRequest(BaseModel):
+class ChatRequest(FrozenModel):
     """Request model for chat endpoint - natural language intent"""
     message: str = Field(..., description="Natural language user intent")
     user_address: Optional[str] = Field(None, description="User's Sui wallet address")
@@ -57,7 +101,7 @@ class ChatRequest(BaseModel):
     }
 
 
-class ExecuteTransactionRequest(BaseModel):
+class ExecuteTransactionRequest(FrozenModel):
     """Request model for transaction execution"""
     transaction_data: Dict[str, Any] = Field(..., description="Transaction data from AI parsing")
     user_address: str = Field(..., description="Sender's Sui wallet address")
@@ -80,7 +124,7 @@ class ExecuteTransactionRequest(BaseModel):
     }
 
 
-class ContactRequest(BaseModel):
+class ContactRequest(FrozenModel):
     """Request model for saving/retrieving contacts"""
     user_address: str = Field(..., description="User's wallet address")
     contact_name: Optional[str] = Field(None, description="Contact's display name (e.g., 'Mom')")
@@ -92,23 +136,23 @@ class ContactRequest(BaseModel):
 # Response Models
 # ============================================================================
 
-class BalanceInfo(BaseModel):
+class BalanceInfo(FrozenModel):
     """Balance information for a token"""
-    token: TokenType
+    token: TokenLiteral
     balance: str
     balance_formatted: str
 
 
-class ContactInfo(BaseModel):
+class ContactInfo(FrozenModel):
     """Contact information (decrypted)"""
     name: str
     address: str
     notes: Optional[str] = None
 
 
-class AIIntentResponse(BaseModel):
+class AIIntentResponse(FrozenModel):
     """Response from AI intent parsing"""
-    action: IntentAction
+    action: IntentActionLiteral
     confidence: float = Field(..., ge=0.0, le=1.0, description="AI confidence score")
     parsed_data: Optional[Dict[str, Any]] = Field(None, description="Extracted parameters")
     clarification_needed: bool = Field(False, description="Whether user clarification is required")
@@ -134,12 +178,12 @@ class AIIntentResponse(BaseModel):
     }
 
 
-class DryRunSummary(BaseModel):
+class DryRunSummary(FrozenModel):
     """Dry run summary before transaction execution"""
     action_description: str
     recipient: str
     amount: str
-    token: TokenType
+    token: TokenLiteral
     estimated_gas_fee: str
     sender_balance_before: str
     sender_balance_after: str
@@ -147,7 +191,7 @@ class DryRunSummary(BaseModel):
     warnings: List[str] = Field(default_factory=list)
 
 
-class TransactionResult(BaseModel):
+class TransactionResult(FrozenModel):
     """Result of a transaction execution"""
     success: bool
     transaction_digest: Optional[str] = None
@@ -155,7 +199,7 @@ class TransactionResult(BaseModel):
     effects: Optional[Dict[str, Any]] = None
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(FrozenModel):
     """Response model for chat endpoint"""
     intent: AIIntentResponse
     dry_run: Optional[DryRunSummary] = None
@@ -168,54 +212,54 @@ class ChatResponse(BaseModel):
 # Internal Models (for service communication)
 # ============================================================================
 
-class TransferTokenParams(BaseModel):
+class TransferTokenParams(FrozenModel):
     """Parameters for token transfer function"""
     recipient: str
     amount: str
-    token: TokenType = TokenType.SUI
+    token: TokenLiteral = "SUI"
 
 
-class ResolveContactParams(BaseModel):
+class ResolveContactParams(FrozenModel):
     """Parameters for contact resolution"""
     name: str
     user_address: str
 
 
-class StakeTokenParams(BaseModel):
+class StakeTokenParams(FrozenModel):
     """Parameters for stake token function"""
     amount: str
-    token: TokenType = TokenType.SUI
+    token: TokenLiteral = "SUI"
 
 
-class UnstakeTokenParams(BaseModel):
+class UnstakeTokenParams(FrozenModel):
     """Parameters for unstake token function"""
     amount: str
-    token: TokenType = TokenType.SUI
+    token: TokenLiteral = "SUI"
 
 
-class StakeInfo(BaseModel):
+class StakeInfo(FrozenModel):
     """Stake information for a user"""
     user_address: str
     staked_amount: str
     staked_amount_formatted: str
-    token: TokenType = TokenType.SUI
+    token: TokenLiteral = "SUI"
 
 
-class EncryptedContactData(BaseModel):
+class EncryptedContactData(FrozenModel):
     """Encrypted contact data structure"""
     name: str
     address: str
     notes: Optional[str] = None
 
 
-class WalrusUploadResponse(BaseModel):
+class WalrusUploadResponse(FrozenModel):
     """Response from Walrus upload"""
     blob_id: str
     size: int
     epochs: int
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(FrozenModel):
     """Standard error response"""
     error: str
     detail: Optional[str] = None
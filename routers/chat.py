@@ -8,8 +8,8 @@ Provides endpoints for:
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, status
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, status, Header, Response
+from typing import Dict, Any, Optional
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -20,7 +20,6 @@ from models.schemas import (
     ExecuteTransactionRequest,
     TransactionResult,
     ContactRequest,
-    ContactInfo,
     IntentAction,
     TokenType,
     ErrorResponse
@@ -31,6 +30,7 @@ from services import (
     walrus_service,
     seal_service
 )
+from utils import next_nonce, unix_seconds
 
 # Create router
 router = APIRouter(prefix="/api/v1", tags=["AI Agent"])
@@ -108,7 +108,7 @@ async def chat_endpoint(request: ChatRequest):
                 intent=intent,
                 dry_run=None,
                 ready_to_execute=False,
-                message=f"Your {balance_info.token.value} balance is {balance_info.balance_formatted}"
+                message=f"Your {balance_info.token} balance is {balance_info.balance_formatted}"
             )
 
         elif intent.action == IntentAction.GET_STAKE_INFO:
@@ -330,29 +330,30 @@ async def chat_endpoint(request: ChatRequest):
 
             # Step 2.2: Get balance and generate dry-run
             token_type = TokenType(parsed_data.get("token", "SUI"))
-            balance_info = await sui_service.get_balance(
-                address=request.user_address,
-                token_type=token_type
-            )
+
+            async def sender_balance() -> str:
+                balance_info = await sui_service.get_balance(
+                    address=request.user_address,
+                    token_type=token_type
+                )
+                return balance_info.balance
 
             # Convert amount to smallest units (MIST for SUI, smallest for USDC)
             amount_str = parsed_data.get("amount", "0")
             decimals = 9 if token_type == TokenType.SUI else 6
             amount_in_smallest = str(int(float(amount_str) * (10 ** decimals)))
 
-            # Estimate gas
-            estimated_gas = await sui_service.estimate_gas_fee(b"")  # Simple estimation
-
-            # Generate dry-run summary
-            dry_run = await openai_service.generate_dry_run_summary(
+            # The balance RPC runs in a worker thread (see get_balance), so it
+            # overlaps the gas estimate instead of blocking the event loop
+            dry_run = await openai_service.prepare_transaction(
                 action="transfer_token",
                 parsed_data={
                     "recipient": recipient,
                     "amount": amount_in_smallest,
                     "token": token_type.value
                 },
-                sender_balance=balance_info.balance,
-                estimated_gas=estimated_gas
+                sender_balance=sender_balance(),
+                estimated_gas=sui_service.estimate_gas_fee(b"")  # Simple estimation
             )
 
             # Build transaction_data for execute endpoint
@@ -450,15 +451,12 @@ async def chat_endpoint(request: ChatRequest):
                 )
 
             # Check if contact already exists
-            contacts_data = sui_service.get_address_book_contacts(address_book["object_id"])
-            existing_contacts = contacts_data.get("contacts", {}) if contacts_data else {}
+            existing_contacts = address_book.get("contacts", {})
             contact_exists = contact_key in existing_contacts
 
             # Store contact data as JSON (MVP - not encrypted for easy resolution)
             # In production, this would use Seal encryption
-            import time
             import json
-            import os
 
             contact_json = json.dumps({
                 "name": contact_name,
@@ -468,8 +466,8 @@ async def chat_endpoint(request: ChatRequest):
             # Convert JSON string to bytes
             contact_data = contact_json.encode('utf-8')
 
-            nonce = os.urandom(16)
-            timestamp = int(time.time())
+            nonce = next_nonce()
+            timestamp = unix_seconds()
 
             # Build add or update contact transaction
             if contact_exists:
@@ -532,8 +530,8 @@ async def chat_endpoint(request: ChatRequest):
                     message="You don't have an address book yet. Say 'Create my address book' to get started!"
                 )
 
-            # Read contacts from on-chain
-            contacts_data = sui_service.get_address_book_contacts(address_book["object_id"])
+            # Contacts are read on-chain together with the address book lookup
+            contacts_data = address_book
 
             if not contacts_data or not contacts_data.get("contacts"):
                 return ChatResponse(
@@ -901,22 +899,16 @@ async def save_contact(request: ContactRequest):
             # Download existing contacts
             blob_id = contact_storage[request.user_address]
             encrypted_data = await walrus_service.download_blob(blob_id)
-            existing_contacts = await seal_service.decrypt_bulk_contacts(
-                user_address=request.user_address,
-                encrypted_data=encrypted_data
-            )
-
-            # Add new contact
-            existing_contacts.append({
-                "name": request.contact_name,
-                "address": request.contact_address,
-                "notes": request.notes
-            })
 
-            # Re-encrypt and upload
-            encrypted_blob = await seal_service.encrypt_bulk_contacts(
+            # Add new contact and re-encrypt
+            encrypted_blob = await seal_service.append_contact(
                 user_address=request.user_address,
-                contacts=[c.model_dump() if isinstance(c, ContactInfo) else c for c in existing_contacts]
+                encrypted_data=encrypted_data,
+                contact={
+                    "name": request.contact_name,
+                    "address": request.contact_address,
+                    "notes": request.notes
+                }
             )
         else:
             # First contact - encrypt single contact
@@ -947,23 +939,52 @@ async def save_contact(request: ContactRequest):
         )
 
 
+# ETag for a user with no saved contacts yet
+EMPTY_CONTACTS_ETAG = '"empty"'
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Whether an If-None-Match header value covers etag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
 @router.get("/contacts/list")
-async def list_contacts(user_address: str):
+async def list_contacts(
+    user_address: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     List all contacts for a user (decrypted)
 
+    The response carries an ETag derived from the contact blob ID (Walrus
+    blob IDs are content-addressed and every save uploads a new blob), so a
+    client sending it back in If-None-Match gets a bodyless 304 and the
+    server skips the download + decrypt.
+
     Args:
         user_address: User's wallet address
+        if_none_match: ETag from a previous response
 
     Returns:
         List of decrypted contacts
     """
     try:
-        if user_address not in contact_storage:
+        blob_id = contact_storage.get(user_address)
+        etag = f'"{blob_id}"' if blob_id else EMPTY_CONTACTS_ETAG
+
+        if _etag_matches(etag, if_none_match):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
+        if blob_id is None:
             return {"contacts": []}
 
         # Download and decrypt contacts
-        blob_id = contact_storage[user_address]
         encrypted_data = await walrus_service.download_blob(blob_id)
         contacts = await seal_service.decrypt_bulk_contacts(
             user_address=user_address,
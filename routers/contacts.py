@@ -11,16 +11,20 @@ Flow:
 4. User retrieves and decrypts their contacts
 """
 
+import base64
 import logging
-import time
 from typing import Optional, List
 
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Field
+import anyio
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response
+from pydantic import Field
 
 from services.sui_service import sui_service
 from services.seal_service import seal_service
 from config import settings
+from models.schemas import FrozenModel
+from utils import TTLCache, next_nonce, unix_seconds
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -28,24 +32,34 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
+_b64encode = base64.b64encode
+
+# AddressBook lookups keyed by user address. An AddressBook is created at most
+# once per user, so only positive results are cached (a "not found" answer
+# would otherwise hide a freshly created book for the whole TTL).
+address_book_cache = TTLCache(
+    ttl=settings.ADDRESS_BOOK_CACHE_TTL,
+    max_size=settings.ADDRESS_BOOK_CACHE_MAX_SIZE
+)
+
 
 # ============================================================================
 # Request/Response Models
 # ============================================================================
 
-class CreateAddressBookRequest(BaseModel):
+class CreateAddressBookRequest(FrozenModel):
     """Request to create a new address book for a user"""
     sender_address: str = Field(..., description="User's wallet address")
 
 
-class CreateAddressBookResponse(BaseModel):
+class CreateAddressBookResponse(FrozenModel):
     """Response containing transaction bytes to sign"""
     transaction_bytes: str = Field(..., description="Base64 encoded transaction bytes")
     action: str = "create_address_book"
     message: str = "Sign this transaction to create your address book"
 
 
-class AddContactRequest(BaseModel):
+class AddContactRequest(FrozenModel):
     """Request to add a new contact"""
     sender_address: str = Field(..., description="User's wallet address")
     address_book_id: str = Field(..., description="User's AddressBook object ID")
@@ -56,7 +70,7 @@ class AddContactRequest(BaseModel):
     signature: Optional[str] = Field(None, description="User signature for encryption key derivation")
 
 
-class AddContactResponse(BaseModel):
+class AddContactResponse(FrozenModel):
     """Response containing transaction bytes for adding contact"""
     transaction_bytes: str = Field(..., description="Base64 encoded transaction bytes")
     contact_key: str = Field(..., description="Contact key")
@@ -64,19 +78,19 @@ class AddContactResponse(BaseModel):
     message: str = "Sign this transaction to save your contact on-chain"
 
 
-class GetAddressBookRequest(BaseModel):
+class GetAddressBookRequest(FrozenModel):
     """Request to get user's address book info"""
     user_address: str = Field(..., description="User's wallet address")
 
 
-class AddressBookInfo(BaseModel):
+class AddressBookInfo(FrozenModel):
     """Response with address book information"""
     exists: bool = Field(..., description="Whether the address book exists")
     object_id: Optional[str] = Field(None, description="AddressBook object ID if exists")
     owner: Optional[str] = Field(None, description="Owner address")
 
 
-class ContactInfo(BaseModel):
+class ContactInfo(FrozenModel):
     """Decrypted contact information"""
     key: str
     name: str
@@ -84,7 +98,7 @@ class ContactInfo(BaseModel):
     notes: Optional[str] = None
 
 
-class ListContactsResponse(BaseModel):
+class ListContactsResponse(FrozenModel):
     """Response with list of contacts"""
     contacts: List[ContactInfo]
     count: int
@@ -104,6 +118,9 @@ async def create_address_book(request: CreateAddressBookRequest):
     """
     try:
         logger.info(f"Creating address book for: {request.sender_address}")
+
+        # The user is about to create a (new) book, drop any cached lookup
+        address_book_cache.pop(request.sender_address)
         
         # Build the transaction
         tx_result = sui_service.build_create_address_book_tx(
@@ -111,8 +128,7 @@ async def create_address_book(request: CreateAddressBookRequest):
         )
         
         # Encode transaction bytes to base64 for frontend
-        import base64
-        tx_bytes_b64 = base64.b64encode(tx_result["transaction_bytes"]).decode()
+        tx_bytes_b64 = _b64encode(tx_result["transaction_bytes"]).decode("ascii")
         
         return CreateAddressBookResponse(
             transaction_bytes=tx_bytes_b64,
@@ -132,16 +148,26 @@ async def get_address_book_info(request: GetAddressBookRequest):
     """
     try:
         logger.info(f"Getting address book info for: {request.user_address}")
+
+        cached = address_book_cache.get(request.user_address)
+        if cached is not None:
+            logger.debug(f"Address book cache hit for: {request.user_address}")
+            return cached
         
-        # Query for address book
-        address_book = sui_service.get_user_address_book(request.user_address)
+        # Query for address book (blocking RPC call, run in a worker thread)
+        address_book = await anyio.to_thread.run_sync(
+            sui_service.get_user_address_book,
+            request.user_address
+        )
         
         if address_book:
-            return AddressBookInfo(
+            info = AddressBookInfo(
                 exists=True,
                 object_id=address_book["object_id"],
                 owner=address_book["owner"]
             )
+            address_book_cache.set(request.user_address, info)
+            return info
         else:
             return AddressBookInfo(
                 exists=False,
@@ -174,12 +200,11 @@ async def add_contact(request: AddContactRequest):
             signature=request.signature
         )
         
-        # Generate a nonce (for additional security, we use a timestamp-based nonce)
-        import os
-        nonce = os.urandom(16)  # 16-byte random nonce
+        # Generate a unique 16-byte nonce (no syscall, see utils.next_nonce)
+        nonce = next_nonce()
         
         # Current timestamp
-        timestamp = int(time.time())
+        timestamp = unix_seconds()
         
         # Step 2: Build the on-chain transaction
         tx_result = sui_service.build_add_contact_tx(
@@ -192,8 +217,7 @@ async def add_contact(request: AddContactRequest):
         )
         
         # Encode transaction bytes to base64
-        import base64
-        tx_bytes_b64 = base64.b64encode(tx_result["transaction_bytes"]).decode()
+        tx_bytes_b64 = _b64encode(tx_result["transaction_bytes"]).decode("ascii")
         
         return AddContactResponse(
             transaction_bytes=tx_bytes_b64,
@@ -207,12 +231,16 @@ async def add_contact(request: AddContactRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Health payload only depends on settings, so serialize it once
+HEALTH_JSON_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "contacts",
+    "package_id": settings.ADDRESS_BOOK_PACKAGE_ID,
+    "module": settings.ADDRESS_BOOK_MODULE
+})
+
+
 @router.get("/health")
 async def contacts_health():
     """Health check for contacts service"""
-    return {
-        "status": "healthy",
-        "service": "contacts",
-        "package_id": settings.ADDRESS_BOOK_PACKAGE_ID,
-        "module": settings.ADDRESS_BOOK_MODULE
-    }
+    return Response(content=HEALTH_JSON_BYTES, media_type="application/json")
@@ -9,6 +9,6 @@ if exist "venv\Scripts\activate.bat" (
 )
 
 REM Start uvicorn
-uvicorn main:app --host 0.0.0.0 --port 8000 --reload --log-level info
+uvicorn main:app --host 0.0.0.0 --port 8000 --reload --http httptools --log-level info
 
 pause
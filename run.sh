@@ -11,4 +11,6 @@ uvicorn main:app \
   --host 0.0.0.0 \
   --port 8000 \
   --reload \
+  --loop uvloop \
+  --http httptools \
   --log-level info
@@ -0,0 +1,80 @@
+"""
+Shared HTTP Connection Pool - Keep-Alive Clients for Outbound RPC
+
+Opening a fresh httpx client per call costs a TCP + TLS handshake for every
+Sui RPC request. This module owns one pooled client per flavour (sync for the
+blocking SuiService helpers, async for coroutine-based services) that is
+reused for the lifetime of the process and closed from the app lifespan.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import httpx
+
+from config import settings
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+
+def _pool_limits() -> httpx.Limits:
+    """Connection limits shared by the sync and async clients"""
+    return httpx.Limits(
+        max_connections=settings.SUI_RPC_POOL_PER_HOST,
+        max_keepalive_connections=settings.SUI_RPC_POOL_PER_HOST,
+        keepalive_expiry=30.0
+    )
+
+
+_sync_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_sync_lock = threading.Lock()
+
+
+def get_sync_client() -> httpx.Client:
+    """
+    Get the process-wide blocking HTTP client
+
+    Safe to call from worker threads; the client is created on first use.
+    """
+    global _sync_client
+    if _sync_client is None:
+        with _sync_lock:
+            if _sync_client is None:
+                logger.info("Creating pooled sync HTTP client")
+                _sync_client = httpx.Client(
+                    timeout=settings.SUI_RPC_REQUEST_TIMEOUT,
+                    limits=_pool_limits()
+                )
+    return _sync_client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client
+
+    Must be called from within the running event loop.
+    """
+    global _async_client
+    if _async_client is None:
+        logger.info("Creating pooled async HTTP client")
+        _async_client = httpx.AsyncClient(
+            timeout=settings.SUI_RPC_REQUEST_TIMEOUT,
+            limits=_pool_limits()
+        )
+    return _async_client
+
+
+async def close_http_clients() -> None:
+    """Close the pooled clients (called on application shutdown)"""
+    global _sync_client, _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    with _sync_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+    logger.info("Pooled HTTP clients closed")
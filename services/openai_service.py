@@ -13,23 +13,312 @@ STRICT MODE BENEFITS:
 - Reliable function calling for blockchain operations
 """
 
-import json
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
-from openai import AsyncOpenAI
+from typing import Optional, Dict, Any, Awaitable, List, Tuple
+
+import httpx
+import orjson
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    AsyncOpenAI,
+    RateLimitError
+)
+from openai.types.chat import ChatCompletion
+from openai.types.chat.chat_completion import Choice
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
 from config import settings
+from utils import TTLCache
 from models.schemas import (
     AIIntentResponse,
     IntentAction,
     TokenType,
+    TOKEN_TYPE_BY_VALUE,
     DryRunSummary
 )
 
 
+# Tool schemas for function calling with STRICT mode.
+# Built once at import time and shared by every request.
+_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "transfer_token",
+            "strict": True,  # CRITICAL: Enables strict mode for guaranteed schema
+            "description": "Transfer tokens (SUI or USDC) to a recipient address or contact name",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "recipient": {
+                        "type": "string",
+                        "description": "Recipient's wallet address (0x...) or contact name if mentioned"
+                    },
+                    "amount": {
+                        "type": "string",
+                        "description": "Amount to transfer in human-readable format (e.g., '100' for 100 SUI)"
+                    },
+                    "token": {
+                        "type": "string",
+                        "enum": ["SUI", "USDC"],  # STRICT ENUM prevents hallucinations
+                        "description": "Token type to transfer"
+                    },
+                    "is_contact_name": {
+                        "type": "boolean",
+                        "description": "True if recipient is a contact name (like 'Mom'), False if it's an address"
+                    }
+                },
+                "required": ["recipient", "amount", "token", "is_contact_name"],
+                "additionalProperties": False
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "resolve_contact",
+            "strict": True,
+            "description": "Look up a contact's wallet address by their name",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "Contact's display name (e.g., 'Mom', 'Boss', 'Alice')"
+                    }
+                },
+                "required": ["name"],
+                "additionalProperties": False
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_balance",
+            "strict": True,
+            "description": "Check the balance of a specific token in the user's wallet",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "token": {
+                        "type": "string",
+                        "enum": ["SUI", "USDC"],
+                        "description": "Token type to check balance for"
+                    }
+                },
+                "required": ["token"],
+                "additionalProperties": False
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "stake_token",
+            "strict": True,
+            "description": "Stake (lock) SUI tokens in the staking pool to earn rewards",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "amount": {
+                        "type": "string",
+                        "description": "Amount of SUI to stake in human-readable format (e.g., '100' for 100 SUI)"
+                    },
+                    "token": {
+                        "type": "string",
+                        "enum": ["SUI"],
+                        "description": "Token type to stake (currently only SUI is supported)"
+                    }
+                },
+                "required": ["amount", "token"],
+                "additionalProperties": False
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "unstake_token",
+            "strict": True,
+            "description": "Unstake (withdraw) SUI tokens from the staking pool",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "amount": {
+                        "type": "string",
+                        "description": "Amount of SUI to unstake in human-readable format (e.g., '50' for 50 SUI)"
+                    },
+                    "token": {
+                        "type": "string",
+                        "enum": ["SUI"],
+                        "description": "Token type to unstake (currently only SUI is supported)"
+                    }
+                },
+                "required": ["amount", "token"],
+                "additionalProperties": False
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_stake_info",
+            "strict": True,
+            "description": "Check how much SUI the user has staked in the staking pool",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "token": {
+                        "type": "string",
+                        "enum": ["SUI"],
+                        "description": "Token type to check stake info for (currently only SUI is supported)"
+                    }
+                },
+                "required": ["token"],
+                "additionalProperties": False
+            }
+        }
+    },
+    # Address Book Operations
+    {
+        "type": "function",
+        "function": {
+            "name": "create_address_book",
+            "strict": True,
+            "description": "Create a new on-chain address book for storing contacts. This is a one-time operation.",
+            "parameters": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+                "additionalProperties": False
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "save_contact",
+            "strict": True,
+            "description": "Save a contact to the user's address book with a name and wallet address",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "contact_key": {
+                        "type": "string",
+                        "description": "Short key for the contact (e.g., 'alice', 'mom', 'boss'). Lowercase, no spaces."
+                    },
+                    "contact_name": {
+                        "type": "string",
+                        "description": "Display name for the contact (e.g., 'Alice Smith', 'Mom')"
+                    },
+                    "contact_address": {
+                        "type": "string",
+                        "description": "Contact's Sui wallet address (starting with 0x)"
+                    },
+                    "notes": {
+                        "type": "string",
+                        "description": "Optional notes about the contact"
+                    }
+                },
+                "required": ["contact_key", "contact_name", "contact_address", "notes"],
+                "additionalProperties": False
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "list_contacts",
+            "strict": True,
+            "description": "List all contacts saved in the user's address book",
+            "parameters": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+                "additionalProperties": False
+            }
+        }
+    }
+]
+
+# Pre-encoded tools block for the raw HTTP fast path
+_TOOLS_JSON = orjson.dumps(_TOOLS)
+
+
+# System prompt for the AI agent
+_SYSTEM_PROMPT = """You are a blockchain AI agent for the Sui network. Understand the user's intent and call the matching function.
+
+RULES:
+1. If the intent is clear, call the function; if amount, recipient or token is missing, ask a short clarification question instead
+2. Contact names (like "Mom", "alice") -> is_contact_name=True; addresses starting with 0x -> is_contact_name=False
+3. Default token is SUI; staking only supports SUI
+4. Contact keys are lowercase with no spaces; use notes="" when none are given
+5. Be helpful and concise
+
+EXAMPLES:
+- "Send money" -> ask how much and to whom
+- "Send 5 SUI to alice" -> transfer_token(recipient="alice", amount="5", token="SUI", is_contact_name=True)
+- "Withdraw 50 from staking" -> unstake_token(amount="50", token="SUI")
+- "Add Mom 0xabc..." -> save_contact(contact_key="mom", contact_name="Mom", contact_address="0xabc...", notes="")
+"""
+
+# Map function name to action
+_ACTION_MAP = {
+    "transfer_token": IntentAction.TRANSFER_TOKEN,
+    "resolve_contact": IntentAction.RESOLVE_CONTACT,
+    "get_balance": IntentAction.GET_BALANCE,
+    "stake_token": IntentAction.STAKE_TOKEN,
+    "unstake_token": IntentAction.UNSTAKE_TOKEN,
+    "get_stake_info": IntentAction.GET_STAKE_INFO,
+    # Address Book Operations
+    "create_address_book": IntentAction.CREATE_ADDRESS_BOOK,
+    "save_contact": IntentAction.SAVE_CONTACT,
+    "list_contacts": IntentAction.LIST_CONTACTS
+}
+
+# Smallest-unit scale per token decimals (SUI: 9, USDC: 6)
+_POW10 = {6: 10 ** 6, 9: 10 ** 9}
+
+
+def _format_units(amount: int, decimals: int, places: int) -> str:
+    """
+    Format an integer amount of base units as a fixed-point string
+
+    Uses integer divmod (truncating to `places` digits), so large amounts
+    don't lose precision the way float division does above 2**53.
+    """
+    sign = "-" if amount < 0 else ""
+    whole, frac = divmod(abs(amount), _POW10[decimals])
+    return f"{sign}{whole}.{str(frac).zfill(decimals)[:places]}"
+
+
+# Statuses the SDK's built-in retries cover besides 429 (disabled via
+# max_retries=0 so tenacity owns retrying): request timeout, lock conflict
+_RETRYABLE_STATUS = {408, 409}
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Rate limits, timeouts, connection errors and 408/409/5xx responses"""
+    if isinstance(exc, (RateLimitError, APITimeoutError, APIConnectionError)):
+        return True
+    return isinstance(exc, APIStatusError) and (
+        exc.status_code >= 500 or exc.status_code in _RETRYABLE_STATUS
+    )
+
+
 class OpenAIService:
     """
     OpenAI Service for intent parsing and transaction preparation
@@ -38,216 +327,176 @@ class OpenAIService:
     """
 
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # One pooled HTTP client for the process lifetime; the default httpx
+        # limits keep too few keep-alive connections for bursty traffic
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE
+            ),
+            timeout=httpx.Timeout(
+                settings.OPENAI_TIMEOUT,
+                connect=settings.OPENAI_CONNECT_TIMEOUT
+            )
+        )
+        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=self._http)
+        # Chat completions are retried by _call_llm (jittered backoff) instead
+        # of the SDK's built-in retries, so the two don't multiply
+        self._llm = self.client.with_options(max_retries=0)
+        # Parsed intents for repeated phrases ("check balance", "show my contacts")
+        self._intent_cache = TTLCache(
+            ttl=settings.INTENT_CACHE_TTL,
+            max_size=settings.INTENT_CACHE_MAX_SIZE
+        )
         self.model = settings.OPENAI_MODEL
-
-        # Define tools for function calling with STRICT mode
-        self.tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "transfer_token",
-                    "strict": True,  # CRITICAL: Enables strict mode for guaranteed schema
-                    "description": "Transfer tokens (SUI or USDC) to a recipient address or contact name",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "recipient": {
-                                "type": "string",
-                                "description": "Recipient's wallet address (0x...) or contact name if mentioned"
-                            },
-                            "amount": {
-                                "type": "string",
-                                "description": "Amount to transfer in human-readable format (e.g., '100' for 100 SUI)"
-                            },
-                            "token": {
-                                "type": "string",
-                                "enum": ["SUI", "USDC"],  # STRICT ENUM prevents hallucinations
-                                "description": "Token type to transfer"
-                            },
-                            "is_contact_name": {
-                                "type": "boolean",
-                                "description": "True if recipient is a contact name (like 'Mom'), False if it's an address"
-                            }
-                        },
-                        "required": ["recipient", "amount", "token", "is_contact_name"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "resolve_contact",
-                    "strict": True,
-                    "description": "Look up a contact's wallet address by their name",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string",
-                                "description": "Contact's display name (e.g., 'Mom', 'Boss', 'Alice')"
-                            }
-                        },
-                        "required": ["name"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_balance",
-                    "strict": True,
-                    "description": "Check the balance of a specific token in the user's wallet",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "token": {
-                                "type": "string",
-                                "enum": ["SUI", "USDC"],
-                                "description": "Token type to check balance for"
-                            }
-                        },
-                        "required": ["token"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "stake_token",
-                    "strict": True,
-                    "description": "Stake (lock) SUI tokens in the staking pool to earn rewards",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "amount": {
-                                "type": "string",
-                                "description": "Amount of SUI to stake in human-readable format (e.g., '100' for 100 SUI)"
-                            },
-                            "token": {
-                                "type": "string",
-                                "enum": ["SUI"],
-                                "description": "Token type to stake (currently only SUI is supported)"
-                            }
-                        },
-                        "required": ["amount", "token"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "unstake_token",
-                    "strict": True,
-                    "description": "Unstake (withdraw) SUI tokens from the staking pool",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "amount": {
-                                "type": "string",
-                                "description": "Amount of SUI to unstake in human-readable format (e.g., '50' for 50 SUI)"
-                            },
-                            "token": {
-                                "type": "string",
-                                "enum": ["SUI"],
-                                "description": "Token type to unstake (currently only SUI is supported)"
-                            }
-                        },
-                        "required": ["amount", "token"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_stake_info",
-                    "strict": True,
-                    "description": "Check how much SUI the user has staked in the staking pool",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "token": {
-                                "type": "string",
-                                "enum": ["SUI"],
-                                "description": "Token type to check stake info for (currently only SUI is supported)"
-                            }
-                        },
-                        "required": ["token"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            # Address Book Operations
-            {
-                "type": "function",
-                "function": {
-                    "name": "create_address_book",
-                    "strict": True,
-                    "description": "Create a new on-chain address book for storing contacts. This is a one-time operation.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "save_contact",
-                    "strict": True,
-                    "description": "Save a contact to the user's address book with a name and wallet address",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "contact_key": {
-                                "type": "string",
-                                "description": "Short key for the contact (e.g., 'alice', 'mom', 'boss'). Lowercase, no spaces."
-                            },
-                            "contact_name": {
-                                "type": "string",
-                                "description": "Display name for the contact (e.g., 'Alice Smith', 'Mom')"
-                            },
-                            "contact_address": {
-                                "type": "string",
-                                "description": "Contact's Sui wallet address (starting with 0x)"
-                            },
-                            "notes": {
-                                "type": "string",
-                                "description": "Optional notes about the contact"
-                            }
-                        },
-                        "required": ["contact_key", "contact_name", "contact_address", "notes"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "list_contacts",
-                    "strict": True,
-                    "description": "List all contacts saved in the user's address book",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                        "additionalProperties": False
-                    }
-                }
-            }
+        self.tools = _TOOLS
+
+        # Fast path: everything but the messages is identical across calls,
+        # so the request body prefix is encoded once
+        self._fast_path_url = f"{self.client.base_url}chat/completions"
+        self._fast_path_headers = {
+            "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        self._fast_path_prefix = (
+            b'{"model":' + orjson.dumps(self.model)
+            + b',"tools":' + _TOOLS_JSON
+            + b',"tool_choice":"auto","max_tokens":' + str(settings.OPENAI_MAX_TOKENS).encode()
+            + b',"messages":'
+        )
+
+    @staticmethod
+    def _build_messages(
+        message: str,
+        user_context: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for one intent parsing request"""
+        # Build context message
+        context_msg = ""
+        if user_context:
+            context_msg = f"\n\nContext: {orjson.dumps(user_context).decode()}"
+
+        return [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": message + context_msg}
         ]
 
+    @staticmethod
+    def _response_to_intent(choice: Choice) -> AIIntentResponse:
+        """
+        Turn the first completion choice into an AIIntentResponse
+
+        Pure function (no I/O, no logging) shared by the live and batch paths.
+        """
+        # Check if AI called a function
+        if choice.finish_reason == "tool_calls" and choice.message.tool_calls:
+            function = choice.message.tool_calls[0].function
+            arguments = orjson.loads(function.arguments)
+            return AIIntentResponse(
+                action=_ACTION_MAP.get(function.name, IntentAction.UNKNOWN),
+                confidence=0.95,  # High confidence due to strict mode
+                parsed_data=arguments,
+                clarification_needed=False,
+                reasoning=f"AI identified {function.name} with parameters: {arguments}"
+            )
+
+        # If no function call, AI needs clarification
+        return AIIntentResponse(
+            action=IntentAction.AMBIGUOUS,
+            confidence=0.5,
+            parsed_data=None,
+            clarification_needed=True,
+            clarification_question=choice.message.content,
+            reasoning="Intent unclear, requesting user clarification"
+        )
+
+    @staticmethod
+    def _error_to_intent(error: Any) -> AIIntentResponse:
+        """Fallback intent asking the user to rephrase after a failed request"""
+        return AIIntentResponse(
+            action=IntentAction.UNKNOWN,
+            confidence=0.0,
+            parsed_data=None,
+            clarification_needed=True,
+            clarification_question=f"I encountered an error: {error}. Could you rephrase your request?",
+            reasoning=f"Error during intent parsing: {error}"
+        )
+
+    @staticmethod
+    def _intent_cache_key(
+        message: str,
+        user_context: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[str, bytes]]:
+        """
+        Cache key for a (stripped) message, or None if it shouldn't be cached
+
+        Messages with digits (amounts) or 0x addresses rarely repeat and may
+        carry sensitive details, so they always go to the model.
+        """
+        normalized = message.lower()
+        if "0x" in normalized or any(c.isdigit() for c in normalized):
+            return None
+        context = orjson.dumps(user_context, option=orjson.OPT_SORT_KEYS) if user_context else b""
+        return normalized, context
+
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        wait=wait_exponential_jitter(initial=0.5, max=8),
+        stop=stop_after_attempt(4),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _call_llm(self, messages: List[Dict[str, str]]) -> ChatCompletion:
+        """Call chat completions, retrying what the SDK's own retries would (see _is_retryable)"""
+        if settings.OPENAI_FAST_PATH:
+            return await self._post_completion(messages)
+        return await self._llm.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            tools=_TOOLS,
+            tool_choice="auto",  # Let AI decide if tool call is needed
+            max_tokens=settings.OPENAI_MAX_TOKENS
+        )
+
+    async def _post_completion(self, messages: List[Dict[str, str]]) -> ChatCompletion:
+        """
+        Raw HTTP chat completion with a pre-encoded body (OPENAI_FAST_PATH)
+
+        Errors are raised as the SDK's exception types so retries and error
+        handling behave the same as on the SDK path.
+        """
+        body = self._fast_path_prefix + orjson.dumps(messages) + b"}"
+        try:
+            response = await self._http.post(
+                self._fast_path_url,
+                content=body,
+                headers=self._fast_path_headers
+            )
+        except httpx.TimeoutException as e:
+            raise APITimeoutError(request=e.request)
+        except httpx.TransportError as e:
+            raise APIConnectionError(request=e.request)
+
+        if response.status_code >= 400:
+            # Error bodies aren't always JSON (e.g. a proxy's HTML 502 page)
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                data = {}
+            error = data.get("error") if isinstance(data, dict) else None
+            if not isinstance(error, dict):
+                error = {}
+            message = error.get("message") or f"HTTP {response.status_code}"
+            if response.status_code == 429:
+                raise RateLimitError(message, response=response, body=error)
+            raise APIStatusError(message, response=response, body=error)
+        return ChatCompletion.model_validate(orjson.loads(response.content))
+
     async def parse_intent(
         self,
         message: str,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        no_cache: bool = False
     ) -> AIIntentResponse:
         """
         Parse natural language message into structured blockchain intent
@@ -257,6 +506,7 @@ class OpenAIService:
         Args:
             message: User's natural language input (e.g., "Send 100 SUI to Mom")
             user_context: Additional context (user address, previous messages, etc.)
+            no_cache: Always call the model, bypassing the intent cache
 
         Returns:
             AIIntentResponse with action, parsed data, and confidence
@@ -266,135 +516,234 @@ class OpenAIService:
             "What's my USDC balance?" -> get_balance(token="USDC")
             "Send money" -> AMBIGUOUS (needs clarification)
         """
-        logger.info(f"Parsing intent for message: {message[:100]}..." if len(message) > 100 else f"Parsing intent for message: {message}")
-        logger.debug(f"User context: {user_context}")
-        
-        try:
-            # System prompt for the AI agent
-            system_prompt = """You are a blockchain AI agent for the Sui network.
-Your job is to understand user intents and call the appropriate function.
-
-AVAILABLE FUNCTIONS:
-1. transfer_token - Send tokens to someone
-2. get_balance - Check wallet balance
-3. stake_token - Lock SUI in staking pool
-4. unstake_token - Withdraw SUI from staking pool
-5. get_stake_info - Check staked amount
-6. resolve_contact - Look up contact address
-7. create_address_book - Create on-chain address book (one-time setup)
-8. save_contact - Save a contact to address book
-9. list_contacts - Show all saved contacts
-
-RULES:
-1. If the intent is clear, call the appropriate function
-2. If critical information is missing (amount, recipient, or token), respond with clarification questions
-3. For contact names (like "Mom", "Boss"), set is_contact_name=True
-4. For wallet addresses (starting with 0x), set is_contact_name=False
-5. If token is not specified, default to SUI
-6. For staking operations, only SUI is supported
-7. Be helpful and concise
-
-DISAMBIGUATION:
-- "Send money" -> Ask: How much and to whom?
-- "Send to Mom" -> Ask: How much?
-- "Send 100" -> Ask: To whom and which token?
-- "Stake" -> Ask: How much SUI would you like to stake?
-- "Save contact" -> Ask: What's the name, address, and optional notes?
-
-STAKING EXAMPLES:
-- "Stake 100 SUI" -> stake_token(amount="100", token="SUI")
-- "Withdraw 50 from staking" -> unstake_token(amount="50", token="SUI")
-- "How much have I staked?" -> get_stake_info(token="SUI")
+        message = message.strip()
+        length = len(message)
+        logger.info("Parsing intent for message: %s%s", message[:100], "..." if length > 100 else "")
+        logger.debug("User context: %s", user_context)
 
-ADDRESS BOOK EXAMPLES:
-- "Create my address book" -> create_address_book()
-- "Save Alice's address 0x123... as alice" -> save_contact(contact_key="alice", contact_name="Alice", contact_address="0x123...", notes="")
-- "Add Mom 0xabc..." -> save_contact(contact_key="mom", contact_name="Mom", contact_address="0xabc...", notes="")
-- "Show my contacts" -> list_contacts()
-- "Send 5 SUI to alice" -> transfer_token(recipient="alice", amount="5", token="SUI", is_contact_name=True)
-"""
+        # Empty or oversized input never needs a model roundtrip
+        if length < 2 or length > settings.MAX_INTENT_CHARS:
+            return AIIntentResponse(
+                action=IntentAction.AMBIGUOUS,
+                confidence=0.0,
+                parsed_data=None,
+                clarification_needed=True,
+                clarification_question=(
+                    "What would you like to do?" if length < 2
+                    else "Please send a shorter, clearer instruction."
+                ),
+                reasoning="Message rejected by length guard"
+            )
 
-            # Build context message
-            context_msg = ""
-            if user_context:
-                context_msg = f"\n\nContext: {json.dumps(user_context)}"
+        cache_key = None if no_cache else self._intent_cache_key(message, user_context)
+        if cache_key is not None:
+            cached = self._intent_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Intent cache hit, action: %s", cached.action)
+                return cached
 
+        try:
             # Call OpenAI with function calling
-            logger.info(f"Calling OpenAI API with model: {self.model}")
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": message + context_msg}
-                ],
-                tools=self.tools,
-                tool_choice="auto"  # Let AI decide if tool call is needed
-            )
+            logger.info("Calling OpenAI API with model: %s", self.model)
+            response = await self._call_llm(self._build_messages(message, user_context))
             logger.info("OpenAI API response received successfully")
 
-            # Parse response
-            choice = response.choices[0]
-            finish_reason = choice.finish_reason
-
-            # Check if AI called a function
-            if finish_reason == "tool_calls" and choice.message.tool_calls:
-                tool_call = choice.message.tool_calls[0]
-                function_name = tool_call.function.name
-                arguments = json.loads(tool_call.function.arguments)
-                logger.info(f"AI called function: {function_name}")
-                logger.debug(f"Function arguments: {arguments}")
-
-                # Map function name to action
-                action_map = {
-                    "transfer_token": IntentAction.TRANSFER_TOKEN,
-                    "resolve_contact": IntentAction.RESOLVE_CONTACT,
-                    "get_balance": IntentAction.GET_BALANCE,
-                    "stake_token": IntentAction.STAKE_TOKEN,
-                    "unstake_token": IntentAction.UNSTAKE_TOKEN,
-                    "get_stake_info": IntentAction.GET_STAKE_INFO,
-                    # Address Book Operations
-                    "create_address_book": IntentAction.CREATE_ADDRESS_BOOK,
-                    "save_contact": IntentAction.SAVE_CONTACT,
-                    "list_contacts": IntentAction.LIST_CONTACTS
+            intent = self._response_to_intent(response.choices[0])
+            if intent.clarification_needed:
+                logger.info("AI did not call a function, requires clarification")
+                logger.debug("Clarification message: %s", intent.clarification_question)
+            else:
+                logger.info("Mapped to action: %s, confidence: %s", intent.action, intent.confidence)
+                logger.debug("Function arguments: %s", intent.parsed_data)
+            if cache_key is not None:
+                self._intent_cache.set(cache_key, intent)
+            return intent
+
+        except Exception as e:
+            # Error handling
+            if isinstance(e, RateLimitError):
+                # Still rate limited after retries (e.g. lower batch concurrency)
+                logger.warning("OpenAI rate limit (429) while parsing intent: %s", e)
+            else:
+                logger.error("Error parsing intent: %s", e, exc_info=True)
+            return self._error_to_intent(e)
+
+    async def parse_intents_batch(
+        self,
+        messages: List[str],
+        user_contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Parse many messages concurrently (backfills, evaluations)
+
+        Requests overlap on the network, bounded by a semaphore so a large
+        batch doesn't trip the OpenAI rate limits all at once.
+
+        Args:
+            messages: User messages to parse
+            user_contexts: Optional per-message context, same length as messages
+            concurrency: Max in-flight requests (default: OPENAI_BATCH_CONCURRENCY)
+
+        Returns:
+            One entry per message, in order: an AIIntentResponse, or the
+            exception raised while parsing that message
+        """
+        if user_contexts is None:
+            user_contexts = [None] * len(messages)
+        elif len(user_contexts) != len(messages):
+            raise ValueError("user_contexts must have the same length as messages")
+
+        semaphore = asyncio.Semaphore(concurrency or settings.OPENAI_BATCH_CONCURRENCY)
+
+        async def _parse_one(message: str, user_context: Optional[Dict[str, Any]]) -> AIIntentResponse:
+            async with semaphore:
+                return await self.parse_intent(message, user_context)
+
+        logger.info("Parsing batch of %d intents", len(messages))
+        results = await asyncio.gather(
+            *(_parse_one(m, c) for m, c in zip(messages, user_contexts)),
+            return_exceptions=True
+        )
+
+        failed = sum(1 for r in results if isinstance(r, BaseException))
+        if failed:
+            logger.warning("%d/%d intents failed to parse", failed, len(messages))
+        return results
+
+    async def submit_intent_batch(
+        self,
+        messages: List[str],
+        user_contexts: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> str:
+        """
+        Submit messages to the OpenAI Batch API for offline intent parsing
+
+        For non-interactive work (evals, replays, analytics). Batch requests
+        cost half as much and use a separate rate limit pool, but complete
+        asynchronously within 24h. Use fetch_intent_batch to read results.
+
+        Args:
+            messages: User messages to parse
+            user_contexts: Optional per-message context, same length as messages
+
+        Returns:
+            Batch ID; results are keyed by "intent-<index into messages>"
+        """
+        if user_contexts is None:
+            user_contexts = [None] * len(messages)
+        elif len(user_contexts) != len(messages):
+            raise ValueError("user_contexts must have the same length as messages")
+
+        lines = [
+            orjson.dumps({
+                "custom_id": f"intent-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._build_messages(message, user_context),
+                    "tools": _TOOLS,
+                    "tool_choice": "auto",
+                    "max_tokens": settings.OPENAI_MAX_TOKENS
                 }
+            })
+            for i, (message, user_context) in enumerate(zip(messages, user_contexts))
+        ]
 
-                action = action_map.get(function_name, IntentAction.UNKNOWN)
-                logger.info(f"Mapped to action: {action}, confidence: 0.95")
+        batch_input = await self.client.files.create(
+            file=("intent_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted intent batch %s with %d requests", batch.id, len(messages))
+        return batch.id
+
+    async def fetch_intent_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+        wait: bool = True
+    ) -> Optional[Dict[str, AIIntentResponse]]:
+        """
+        Fetch the parsed intents of a batch submitted with submit_intent_batch
 
-                return AIIntentResponse(
-                    action=action,
-                    confidence=0.95,  # High confidence due to strict mode
-                    parsed_data=arguments,
-                    clarification_needed=False,
-                    reasoning=f"AI identified {function_name} with parameters: {arguments}"
-                )
+        Args:
+            batch_id: ID returned by submit_intent_batch
+            poll_interval: Seconds between status checks while waiting
+            wait: Poll until the batch finishes; if False, return None
+                  when it is still running
 
-            # If no function call, AI needs clarification
-            else:
-                ai_message = choice.message.content
-                logger.info("AI did not call a function, requires clarification")
-                logger.debug(f"Clarification message: {ai_message}")
+        Returns:
+            Dict of custom_id -> AIIntentResponse. Requests that failed
+            inside the batch map to an UNKNOWN intent.
+
+        Raises:
+            ValueError: If the batch failed, expired or was cancelled
+        """
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled", "cancelling"):
+                raise ValueError(f"Intent batch {batch_id} ended with status: {batch.status}")
+            if not wait:
+                return None
+            logger.debug("Intent batch %s status: %s", batch_id, batch.status)
+            await asyncio.sleep(poll_interval)
+
+        results: Dict[str, AIIntentResponse] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self.client.files.content(file_id)
+            for line in content.content.splitlines():
+                if not line:
+                    continue
+                item = orjson.loads(line)
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    error = item.get("error") or response.get("body", {}).get("error")
+                    results[item["custom_id"]] = self._error_to_intent(error)
+                    continue
+                completion = ChatCompletion.model_validate(response["body"])
+                results[item["custom_id"]] = self._response_to_intent(completion.choices[0])
+
+        logger.info("Fetched %d intents from batch %s", len(results), batch_id)
+        return results
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called from the app lifespan)"""
+        await self._http.aclose()
+
+    async def prepare_transaction(
+        self,
+        action: str,
+        parsed_data: Dict[str, Any],
+        sender_balance: Awaitable[str],
+        estimated_gas: Awaitable[str]
+    ) -> DryRunSummary:
+        """
+        Await balance and gas estimate together, then build the dry-run
 
-                return AIIntentResponse(
-                    action=IntentAction.AMBIGUOUS,
-                    confidence=0.5,
-                    parsed_data=None,
-                    clarification_needed=True,
-                    clarification_question=ai_message,
-                    reasoning="Intent unclear, requesting user clarification"
-                )
+        The awaitables only overlap if they yield to the event loop (e.g.
+        sui_service.get_balance runs its blocking RPC in a worker thread).
 
-        except Exception as e:
-            # Error handling
-            logger.error(f"Error parsing intent: {str(e)}", exc_info=True)
-            return AIIntentResponse(
-                action=IntentAction.UNKNOWN,
-                confidence=0.0,
-                parsed_data=None,
-                clarification_needed=True,
-                clarification_question=f"I encountered an error: {str(e)}. Could you rephrase your request?",
-                reasoning=f"Error during intent parsing: {str(e)}"
-            )
+        Args:
+            action: The action being performed
+            parsed_data: Parsed parameters from AI
+            sender_balance: Awaitable resolving to the sender's balance
+            estimated_gas: Awaitable resolving to the estimated gas fee
+
+        Returns:
+            DryRunSummary with all transaction details
+        """
+        balance, gas = await asyncio.gather(sender_balance, estimated_gas)
+        return await self.generate_dry_run_summary(action, parsed_data, balance, gas)
 
     async def generate_dry_run_summary(
         self,
@@ -425,7 +774,7 @@ ADDRESS BOOK EXAMPLES:
             # Extract transfer details
             recipient = parsed_data.get("recipient", "Unknown")
             amount = parsed_data.get("amount", "0")
-            token = TokenType(parsed_data.get("token", "SUI"))
+            token = TOKEN_TYPE_BY_VALUE.get(parsed_data.get("token", "SUI"), TokenType.SUI)
 
             # Convert to integers for calculation
             amount_int = int(amount)
@@ -454,15 +803,15 @@ ADDRESS BOOK EXAMPLES:
                 warnings = []
 
             # Additional warnings
-            if amount_int > balance_int * 0.9:  # Sending >90% of balance
+            if amount_int * 10 > balance_int * 9:  # Sending >90% of balance
                 warnings.append("You're sending most of your balance!")
 
             # Format amounts for display
             decimals = 9 if token == TokenType.SUI else 6
-            amount_formatted = f"{amount_int / (10 ** decimals):.4f}"
-            gas_formatted = f"{gas_int / 1_000_000_000:.6f}"  # Gas always in SUI
-            balance_before_formatted = f"{balance_int / (10 ** decimals):.4f}"
-            balance_after_formatted = f"{balance_after / (10 ** decimals):.4f}"
+            amount_formatted = _format_units(amount_int, decimals, 4)
+            gas_formatted = _format_units(gas_int, 9, 6)  # Gas always in SUI
+            balance_before_formatted = _format_units(balance_int, decimals, 4)
+            balance_after_formatted = _format_units(balance_after, decimals, 4)
 
             # Generate action description
             action_description = f"Transfer {amount_formatted} {token.value} to {recipient}"
@@ -485,7 +834,7 @@ ADDRESS BOOK EXAMPLES:
                 action_description=f"Transfer to {parsed_data.get('recipient')}",
                 recipient=parsed_data.get('recipient', 'Unknown'),
                 amount=parsed_data.get('amount', '0'),
-                token=TokenType(parsed_data.get('token', 'SUI')),
+                token=TOKEN_TYPE_BY_VALUE.get(parsed_data.get('token', 'SUI'), TokenType.SUI),
                 estimated_gas_fee="0.002",
                 sender_balance_before="Unknown",
                 sender_balance_after="Unknown",
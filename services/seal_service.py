@@ -11,21 +11,23 @@ PRIVACY-FIRST APPROACH:
 - Encrypted data is stored on decentralized Walrus storage
 """
 
-import json
 import base64
 import hashlib
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
-from cryptography.fernet import Fernet
+import anyio
+import orjson
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 
 from models.schemas import EncryptedContactData, ContactInfo
 from config import settings
+from utils import TTLCache
 
 
 class SealService:
@@ -38,26 +40,75 @@ class SealService:
 
     def __init__(self):
         self.salt = settings.SECRET_KEY.encode()
+        # Ready-to-use Fernet instances per (user_address, signature, kdf), so
+        # repeated calls for a user skip both key derivation and Fernet setup
+        self._fernet_cache = TTLCache(
+            ttl=settings.SEAL_KEY_CACHE_TTL,
+            max_size=settings.SEAL_KEY_CACHE_MAX_SIZE
+        )
+
+    def _build_fernet(self, user_address: str, signature: Optional[str], kdf: str) -> Fernet:
+        """Get the cached Fernet for a user, deriving its key on cache miss"""
+        cache_key = (user_address, signature, kdf)
+        fernet = self._fernet_cache.get(cache_key)
+        if fernet is None:
+            # Fernet takes its key base64-encoded; encode once, at this boundary
+            raw_key = self._derive_key_from_signature(user_address, signature, kdf)
+            fernet = Fernet(base64.urlsafe_b64encode(raw_key))
+            self._fernet_cache.set(cache_key, fernet)
+        return fernet
+
+    async def _get_fernet(
+        self,
+        user_address: str,
+        signature: str = None,
+        kdf: Optional[str] = None
+    ) -> Fernet:
+        """
+        Get the Fernet for a user without blocking the event loop
 
-    def _derive_key_from_signature(self, user_address: str, signature: str = None) -> bytes:
+        Cached instances and BLAKE2b derivations are handled inline; a PBKDF2
+        cache miss runs in a worker thread so other requests keep being
+        served meanwhile.
+        """
+        kdf = kdf or settings.SEAL_KDF
+        fernet = self._fernet_cache.get((user_address, signature, kdf))
+        if fernet is not None:
+            return fernet
+        if kdf == "blake2b":
+            return self._build_fernet(user_address, signature, kdf)
+        return await anyio.to_thread.run_sync(
+            self._build_fernet, user_address, signature, kdf
+        )
+
+    def _derive_key_from_signature(self, user_address: str, signature: str = None, kdf: str = "blake2b") -> bytes:
         """
         Derive encryption key from user's wallet address and signature
 
         In a production environment, this would use the user's actual wallet signature.
         For MVP, we derive from address + secret key.
 
+        The key material is a wallet address plus a signature or the server
+        secret, not a low-entropy user password, so a single keyed BLAKE2b
+        hash is sufficient. PBKDF2 stays available (SEAL_KDF=pbkdf2) and is
+        used to read contacts encrypted before the switch.
+
         Args:
             user_address: User's Sui wallet address
             signature: User's signature (optional for MVP)
+            kdf: "blake2b" or "pbkdf2"
 
         Returns:
-            32-byte encryption key
+            Raw 32-byte encryption key
         """
         # Combine user address with signature (or secret key for MVP)
         key_material = f"{user_address}:{signature or settings.SECRET_KEY}".encode()
 
+        if kdf == "blake2b":
+            return hashlib.blake2b(key_material, key=self.salt[:64], digest_size=32).digest()
+
         # Use PBKDF2HMAC to derive a strong key
-        kdf = PBKDF2HMAC(
+        pbkdf2 = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=32,
             salt=self.salt,
@@ -65,8 +116,33 @@ class SealService:
             backend=default_backend()
         )
 
-        key = base64.urlsafe_b64encode(kdf.derive(key_material))
-        return key
+        return pbkdf2.derive(key_material)
+
+    async def _decrypt(
+        self,
+        user_address: str,
+        signature: Optional[str],
+        tokens: list[bytes]
+    ) -> list[bytes]:
+        """
+        Decrypt Fernet tokens, falling back to the legacy PBKDF2 key
+
+        Raises:
+            InvalidToken: If a token matches neither key
+        """
+        fernet = await self._get_fernet(user_address, signature)
+        legacy = None
+        plaintexts = []
+        for token in tokens:
+            try:
+                plaintexts.append(fernet.decrypt(token))
+            except InvalidToken:
+                if settings.SEAL_KDF == "pbkdf2":
+                    raise
+                if legacy is None:
+                    legacy = await self._get_fernet(user_address, signature, "pbkdf2")
+                plaintexts.append(legacy.decrypt(token))
+        return plaintexts
 
     async def encrypt_contact(
         self,
@@ -103,13 +179,10 @@ class SealService:
         )
 
         # Serialize to JSON
-        plaintext = json.dumps(contact_data.model_dump()).encode()
+        plaintext = orjson.dumps(contact_data.model_dump())
 
-        # Derive encryption key from user signature
-        key = self._derive_key_from_signature(user_address, signature)
-
-        # Encrypt using Fernet
-        fernet = Fernet(key)
+        # Encrypt using Fernet with the key derived from user signature
+        fernet = await self._get_fernet(user_address, signature)
         encrypted_bytes = fernet.encrypt(plaintext)
 
         return encrypted_bytes
@@ -140,15 +213,11 @@ class SealService:
             ValueError: If decryption fails (wrong signature/corrupted data)
         """
         try:
-            # Derive decryption key from user signature
-            key = self._derive_key_from_signature(user_address, signature)
-
-            # Decrypt using Fernet
-            fernet = Fernet(key)
-            plaintext = fernet.decrypt(encrypted_data)
+            # Decrypt using Fernet with the key derived from user signature
+            plaintext, = await self._decrypt(user_address, signature, [encrypted_data])
 
             # Deserialize from JSON
-            contact_dict = json.loads(plaintext.decode())
+            contact_dict = orjson.loads(plaintext)
             contact_info = ContactInfo(**contact_dict)
 
             return contact_info
@@ -177,11 +246,10 @@ class SealService:
             Encrypted bytes containing all contacts
         """
         # Serialize all contacts
-        plaintext = json.dumps(contacts).encode()
+        plaintext = orjson.dumps(contacts)
 
         # Derive key and encrypt
-        key = self._derive_key_from_signature(user_address, signature)
-        fernet = Fernet(key)
+        fernet = await self._get_fernet(user_address, signature)
         encrypted_bytes = fernet.encrypt(plaintext)
 
         return encrypted_bytes
@@ -205,17 +273,105 @@ class SealService:
         """
         try:
             # Derive key and decrypt
-            key = self._derive_key_from_signature(user_address, signature)
-            fernet = Fernet(key)
-            plaintext = fernet.decrypt(encrypted_data)
+            plaintext, = await self._decrypt(user_address, signature, [encrypted_data])
 
             # Deserialize
-            contacts_list = json.loads(plaintext.decode())
+            contacts_list = orjson.loads(plaintext)
             return [ContactInfo(**c) for c in contacts_list]
 
         except Exception as e:
             raise ValueError(f"Failed to decrypt contacts: {str(e)}")
 
+    async def append_contact(
+        self,
+        user_address: str,
+        encrypted_data: bytes,
+        contact: Dict[str, Any],
+        signature: str = None
+    ) -> bytes:
+        """
+        Add one contact to an encrypted address book blob
+
+        The decrypted plaintext is the JSON array written by
+        encrypt_bulk_contacts; the new contact is spliced onto its end, so
+        existing contacts are not parsed, validated and re-serialized.
+
+        Args:
+            user_address: User's wallet address
+            encrypted_data: Encrypted address book from Walrus
+            contact: Contact dictionary to add
+            signature: User's signature
+
+        Returns:
+            Encrypted bytes containing all contacts
+
+        Raises:
+            ValueError: If the existing blob can't be decrypted
+        """
+        try:
+            plaintext, = await self._decrypt(user_address, signature, [encrypted_data])
+        except Exception as e:
+            raise ValueError(f"Failed to decrypt contacts: {str(e)}")
+
+        plaintext = plaintext.rstrip()
+        if not plaintext.startswith(b"[") or not plaintext.endswith(b"]"):
+            raise ValueError("Failed to decrypt contacts: unexpected address book format")
+        separator = b"" if plaintext[1:-1].strip() == b"" else b","
+        updated = plaintext[:-1] + separator + orjson.dumps(contact) + b"]"
+
+        fernet = await self._get_fernet(user_address, signature)
+        return fernet.encrypt(updated)
+
+    async def encrypt_contacts_individually(
+        self,
+        user_address: str,
+        contacts: list[Dict[str, Any]],
+        signature: str = None
+    ) -> list[bytes]:
+        """
+        Encrypt each contact into its own ciphertext (one per on-chain entry)
+
+        The key is derived and the Fernet instance built once for the whole
+        list, instead of once per contact as with repeated encrypt_contact calls.
+
+        Args:
+            user_address: User's wallet address
+            contacts: List of contact dictionaries
+            signature: User's signature
+
+        Returns:
+            Encrypted bytes for each contact, in order
+        """
+        fernet = await self._get_fernet(user_address, signature)
+        return [fernet.encrypt(orjson.dumps(contact)) for contact in contacts]
+
+    async def decrypt_contacts_individually(
+        self,
+        user_address: str,
+        encrypted_contacts: list[bytes],
+        signature: str = None
+    ) -> list[ContactInfo]:
+        """
+        Decrypt a list of individually encrypted contacts
+
+        Args:
+            user_address: User's wallet address
+            encrypted_contacts: Encrypted bytes for each contact
+            signature: User's signature
+
+        Returns:
+            List of decrypted contacts, in order
+
+        Raises:
+            ValueError: If any contact fails to decrypt
+        """
+        try:
+            plaintexts = await self._decrypt(user_address, signature, encrypted_contacts)
+            return [ContactInfo(**orjson.loads(p)) for p in plaintexts]
+
+        except Exception as e:
+            raise ValueError(f"Failed to decrypt contacts: {str(e)}")
+
 
 # Global service instance
 seal_service = SealService()
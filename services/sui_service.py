@@ -5,8 +5,14 @@ Implements interaction with Sui blockchain using pysui SDK.
 Handles balance queries, transaction building (PTB), and execution.
 """
 
+import functools
+import itertools
 import logging
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, List
+
+import anyio
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -17,6 +23,7 @@ from pysui.sui.sui_types.collections import SuiArray
 
 from config import settings
 from models.schemas import TokenType, BalanceInfo, TransactionResult, StakeInfo
+from services.http_pool import get_sync_client
 
 
 # Token type identifiers on Sui (Testnet)
@@ -27,6 +34,48 @@ TOKEN_TYPES = {
 }
 
 
+class RpcCircuitBreaker:
+    """
+    Fail fast when the Sui RPC endpoint is unhealthy
+
+    After `failure_threshold` consecutive transport failures the breaker opens
+    and calls are rejected immediately for `reset_timeout` seconds, instead of
+    every dependent request waiting out its own timeout. The first call after
+    that window is let through as a probe.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: allow a probe, re-open on its failure
+                self._opened_at = None
+                self._failures = self.failure_threshold - 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold and self._opened_at is None:
+                logger.warning(f"Sui RPC circuit opened after {self._failures} consecutive failures")
+                self._opened_at = time.monotonic()
+
+
 class SuiService:
     """
     Sui Blockchain Service for transaction building and execution
@@ -45,8 +94,64 @@ class SuiService:
             rpc_url=settings.SUI_RPC_URL
         )
         self.client = SyncClient(self.config)
+        # JSON-RPC ids must be non-zero for some gateways, so start at 1
+        self._rpc_ids = itertools.count(1)
+        self.rpc_breaker = RpcCircuitBreaker()
         logger.info("SuiService initialized successfully")
 
+    def batch_call(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several JSON-RPC calls to the Sui fullnode in one HTTP request
+
+        Args:
+            calls: List of {"method": ..., "params": [...]} dictionaries
+
+        Returns:
+            JSON-RPC response objects in the same order as `calls`
+
+        Raises:
+            ValueError: If the circuit breaker is open or the transport fails
+        """
+        if not self.rpc_breaker.allow():
+            raise ValueError("Sui RPC temporarily unavailable (circuit open)")
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": next(self._rpc_ids),
+                "method": call["method"],
+                "params": call.get("params", [])
+            }
+            for call in calls
+        ]
+
+        try:
+            response = get_sync_client().post(
+                settings.SUI_RPC_URL,
+                json=payload[0] if len(payload) == 1 else payload
+            )
+            response.raise_for_status()
+            result = response.json()
+        except Exception as e:
+            self.rpc_breaker.record_failure()
+            raise ValueError(f"Sui RPC request failed: {str(e)}")
+
+        self.rpc_breaker.record_success()
+
+        if isinstance(result, dict):
+            return [result]
+
+        # Batch responses may arrive in any order, match them back by id
+        by_id = {item.get("id"): item for item in result}
+        return [
+            by_id.get(item["id"], {"error": {"message": "Missing response in batch"}})
+            for item in payload
+        ]
+
+    def rpc_call(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        """Send a single JSON-RPC call (see batch_call)"""
+        return self.batch_call([{"method": method, "params": params}])[0]
+
     async def get_balance(
         self,
         address: str,
@@ -70,9 +175,12 @@ class SuiService:
             sui_address = SuiAddress(address)
 
             if token_type == TokenType.SUI:
-                # Get SUI balance
+                # Get SUI balance; pysui is blocking, so the RPC runs in a
+                # worker thread and callers can overlap it with other awaits
                 logger.debug("Fetching SUI gas objects...")
-                result = self.client.get_gas(sui_address)
+                result = await anyio.to_thread.run_sync(
+                    self.client.get_gas, sui_address
+                )
 
                 if result.is_ok():
                     # Sum all gas objects
@@ -102,9 +210,12 @@ class SuiService:
 
                 # Get coin objects of specific type
                 logger.debug(f"Fetching {token_type.value} coin objects...")
-                result = self.client.get_coin(
-                    coin_type=coin_type,
-                    address=sui_address
+                result = await anyio.to_thread.run_sync(
+                    functools.partial(
+                        self.client.get_coin,
+                        coin_type=coin_type,
+                        address=sui_address
+                    )
                 )
 
                 if result.is_ok():
@@ -388,19 +499,15 @@ class SuiService:
             
             logger.info("Discovering StakePool object...")
             
-            import httpx
-            
             # Query for package initialization transaction to find created objects
             # The StakePool is a shared object created by the init function
             stake_pool_type = f"{settings.STAKE_PACKAGE_ID}::{settings.STAKE_MODULE}::StakePool"
             
             # Use suix_queryEvents to find the package publish transaction
             # Then get the created objects from it
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "suix_queryEvents",
-                "params": [
+            result = self.rpc_call(
+                "suix_queryEvents",
+                [
                     {
                         "MoveModule": {
                             "package": settings.STAKE_PACKAGE_ID,
@@ -411,10 +518,7 @@ class SuiService:
                     1,
                     False
                 ]
-            }
-            
-            response = httpx.post(settings.SUI_RPC_URL, json=payload, timeout=10.0)
-            result = response.json()
+            )
             
             # If we can find an event, we can trace back to the StakePool
             # For now, return None and require manual configuration
@@ -526,24 +630,17 @@ class SuiService:
         try:
             logger.info(f"Getting stake info for {user_address} from pool {stake_pool_id}")
             
-            import httpx
-            
             # First, get the StakePool object to check if user has stake
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "sui_getObject",
-                "params": [
+            result = self.rpc_call(
+                "sui_getObject",
+                [
                     stake_pool_id,
                     {
                         "showType": True,
                         "showContent": True
                     }
                 ]
-            }
-            
-            response = httpx.post(settings.SUI_RPC_URL, json=payload, timeout=10.0)
-            result = response.json()
+            )
             
             if "error" in result:
                 logger.error(f"RPC error: {result['error']}")
@@ -764,29 +861,26 @@ class SuiService:
         """
         Find the user's AddressBook object on-chain
 
+        The owned-objects query already returns the object content, so the
+        decoded contacts are included and callers don't need a second
+        sui_getObject round-trip.
+
         Args:
             user_address: User's wallet address
 
         Returns:
-            Dictionary with address book info or None if not found
+            Dictionary with address book info and contacts, or None if not found
         """
         try:
             logger.info(f"Looking up AddressBook for user: {user_address}")
 
-            # Query owned objects using Sui RPC
-            import httpx
-
             # Build the type filter for AddressBook
             address_book_type = f"{settings.ADDRESS_BOOK_PACKAGE_ID}::{settings.ADDRESS_BOOK_MODULE}::AddressBook"
 
-            # Use suix_getOwnedObjects RPC call
-            rpc_url = settings.SUI_RPC_URL
-
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "suix_getOwnedObjects",
-                "params": [
+            # Query owned objects using suix_getOwnedObjects RPC call
+            result = self.rpc_call(
+                "suix_getOwnedObjects",
+                [
                     user_address,
                     {
                         "filter": {
@@ -799,10 +893,7 @@ class SuiService:
                         }
                     }
                 ]
-            }
-
-            response = httpx.post(rpc_url, json=payload, timeout=10.0)
-            result = response.json()
+            )
 
             if "error" in result:
                 logger.error(f"RPC error: {result['error']}")
@@ -815,16 +906,19 @@ class SuiService:
                 return None
 
             # Get the first AddressBook (user should only have one)
-            address_book = data[0]
-            object_id = address_book.get("data", {}).get("objectId")
+            obj_data = data[0].get("data", {})
+            object_id = obj_data.get("objectId")
 
             logger.info(f"Found AddressBook: {object_id}")
 
-            return {
+            book = self._parse_address_book(object_id, obj_data.get("content", {})) or {
                 "object_id": object_id,
-                "owner": user_address,
-                "type": address_book_type
+                "contact_count": 0,
+                "contacts": {}
             }
+            book["owner"] = user_address
+            book["type"] = address_book_type
+            return book
 
         except Exception as e:
             logger.error(f"Error looking up AddressBook: {str(e)}", exc_info=True)
@@ -843,68 +937,73 @@ class SuiService:
         try:
             logger.info(f"Reading AddressBook contacts: {address_book_id}")
 
-            import httpx
-
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "sui_getObject",
-                "params": [
+            result = self.rpc_call(
+                "sui_getObject",
+                [
                     address_book_id,
                     {
                         "showType": True,
                         "showContent": True
                     }
                 ]
-            }
-
-            response = httpx.post(settings.SUI_RPC_URL, json=payload, timeout=10.0)
-            result = response.json()
+            )
 
             if "error" in result:
                 logger.error(f"RPC error: {result['error']}")
                 return None
 
             obj_data = result.get("result", {}).get("data", {})
-            content = obj_data.get("content", {})
-
-            if content.get("dataType") != "moveObject":
-                logger.error(f"Unexpected data type: {content.get('dataType')}")
-                return None
+            return self._parse_address_book(address_book_id, obj_data.get("content", {}))
 
-            fields = content.get("fields", {})
-            contacts_map = fields.get("contacts", {})
-
-            # VecMap is stored as an array of {key, value} pairs
-            contacts = {}
-            if isinstance(contacts_map, dict) and "fields" in contacts_map:
-                # Handle VecMap structure: {type, fields: {contents: [{fields: {key, value}}]}}
-                contents = contacts_map.get("fields", {}).get("contents", [])
-                for entry in contents:
-                    entry_fields = entry.get("fields", {})
-                    contact_key = entry_fields.get("key", "")
-                    value_fields = entry_fields.get("value", {}).get("fields", {})
-
-                    contacts[contact_key] = {
-                        "encrypted_data": value_fields.get("encrypted_data", []),
-                        "nonce": value_fields.get("nonce", []),
-                        "created_at": value_fields.get("created_at", 0),
-                        "updated_at": value_fields.get("updated_at", 0)
-                    }
+        except Exception as e:
+            logger.error(f"Error reading AddressBook contacts: {str(e)}", exc_info=True)
+            return None
 
-            logger.info(f"Found {len(contacts)} contacts in AddressBook")
+    @staticmethod
+    def _parse_address_book(address_book_id: str, content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Decode AddressBook Move object content into a contacts dictionary
 
-            return {
-                "object_id": address_book_id,
-                "owner": fields.get("owner", ""),
-                "contact_count": fields.get("contact_count", 0),
-                "contacts": contacts
-            }
+        Args:
+            address_book_id: The AddressBook object ID
+            content: The "content" field of a Sui object response
 
-        except Exception as e:
-            logger.error(f"Error reading AddressBook contacts: {str(e)}", exc_info=True)
+        Returns:
+            Dictionary with contacts data or None if content is not a Move object
+        """
+        if content.get("dataType") != "moveObject":
+            logger.error(f"Unexpected data type: {content.get('dataType')}")
             return None
 
+        fields = content.get("fields", {})
+        contacts_map = fields.get("contacts", {})
+
+        # VecMap is stored as an array of {key, value} pairs
+        contacts = {}
+        if isinstance(contacts_map, dict) and "fields" in contacts_map:
+            # Handle VecMap structure: {type, fields: {contents: [{fields: {key, value}}]}}
+            contents = contacts_map.get("fields", {}).get("contents", [])
+            for entry in contents:
+                entry_fields = entry.get("fields", {})
+                contact_key = entry_fields.get("key", "")
+                value_fields = entry_fields.get("value", {}).get("fields", {})
+
+                contacts[contact_key] = {
+                    "encrypted_data": value_fields.get("encrypted_data", []),
+                    "nonce": value_fields.get("nonce", []),
+                    "created_at": value_fields.get("created_at", 0),
+                    "updated_at": value_fields.get("updated_at", 0)
+                }
+
+        logger.info(f"Found {len(contacts)} contacts in AddressBook")
+
+        return {
+            "object_id": address_book_id,
+            "owner": fields.get("owner", ""),
+            "contact_count": fields.get("contact_count", 0),
+            "contacts": contacts
+        }
+
     def resolve_contact_address(self, user_address: str, contact_key: str) -> Optional[str]:
         """
         Resolve a contact name to a wallet address.
@@ -919,19 +1018,13 @@ class SuiService:
         try:
             logger.info(f"Resolving contact '{contact_key}' for user {user_address}")
 
-            # Get user's address book
+            # Get user's address book (includes decoded contacts)
             address_book = self.get_user_address_book(user_address)
             if not address_book:
                 logger.info("No address book found")
                 return None
 
-            # Get contacts from address book
-            contacts_data = self.get_address_book_contacts(address_book["object_id"])
-            if not contacts_data:
-                logger.info("Could not read contacts from address book")
-                return None
-
-            contacts = contacts_data.get("contacts", {})
+            contacts = address_book.get("contacts", {})
             
             # Case-insensitive lookup - try exact match first, then case-insensitive
             contact_key_normalized = contact_key.lower().replace(" ", "_")
@@ -7,19 +7,89 @@ Handles wallet operations including:
 - Executing transactions on Sui blockchain
 """
 
+import copy
+import functools
 import logging
-from typing import Optional, Dict, Any
+from operator import attrgetter
+from typing import Optional, Dict, Any, Union
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 from pysui import SuiConfig, SyncClient
 from pysui.sui.sui_types.address import SuiAddress
-from pysui.sui.sui_crypto import SuiPrivateKey
 from pysui.sui.sui_txn import SyncTransaction
 
 from config import settings
 from models.schemas import TransactionResult, TokenType
 
+_coin_balance = attrgetter("balance")
+
+# Explicit gas budget for transfers (0.01 SUI), which also skips pysui's dry run
+TRANSFER_GAS_BUDGET = 10_000_000
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_sync_client(rpc_url: str) -> SyncClient:
+    """
+    Key-less RPC client whose connection pool all WalletService instances share
+
+    Creating a SyncClient per wallet would open a fresh connection pool
+    against the RPC node (and re-fetch the RPC schema) each time.
+    """
+    return SyncClient(SuiConfig.user_config(rpc_url=rpc_url))
+
+
+def _wallet_client(config: SuiConfig) -> SyncClient:
+    """
+    RPC client bound to one wallet's own config
+
+    pysui's constructor always opens its own HTTP pool and re-fetches the RPC
+    descriptors, so the shared client is shallow-copied instead: the pool and
+    descriptors are reused, while signing (which pysui resolves through
+    client.config) only ever sees this wallet's keypair. Keys therefore never
+    accumulate in a process-wide config.
+
+    Swapping the config relies on Provider storing it in _config (pysui is
+    pinned in requirements.txt); if that no longer takes effect, a dedicated
+    client is built through the public constructor rather than signing with
+    the shared key-less config.
+    """
+    client = copy.copy(_shared_sync_client(config.rpc_url))
+    client._config = config
+    if client.config is not config:
+        logger.warning("pysui client config could not be swapped, creating a dedicated SyncClient")
+        return SyncClient(config)
+    return client
+
+
+@functools.lru_cache(maxsize=4096)
+def _sui_address(address: str) -> SuiAddress:
+    """Parse an address once; recurring senders/recipients reuse the instance"""
+    return SuiAddress(address)
+
+
+def _parse_amount(amount: Union[int, float, str]) -> Optional[int]:
+    """
+    Amount in smallest units as an int, or None if it is not a non-negative integer
+
+    ints pass straight through; strings are parsed with an explicit base so
+    int() skips prefix auto-detection. Integral floats (JSON numbers like
+    1000000000.0) are accepted. Negative/fractional values, bools and any
+    other type are rejected up front instead of surfacing as an exception.
+    """
+    if isinstance(amount, bool):
+        return None
+    if isinstance(amount, int):
+        return amount if amount >= 0 else None
+    if isinstance(amount, float):
+        return int(amount) if amount >= 0 and amount.is_integer() else None
+    if not isinstance(amount, str) or amount.startswith("-") or "." in amount:
+        return None
+    try:
+        return int(amount, 10)
+    except ValueError:
+        return None
+
 
 class WalletService:
     """
@@ -37,15 +107,15 @@ class WalletService:
             private_key_str: Sui private key in format 'suiprivkey1q...'
         """
         logger.info("Initializing WalletService...")
-        # Initialize Sui client
-        self.config = SuiConfig.user_config(
-            rpc_url=settings.SUI_RPC_URL
-        )
-        self.client = SyncClient(self.config)
+
+        # Per-wallet config (holds only this wallet's key) on the shared client
+        self.config = SuiConfig.user_config(rpc_url=settings.SUI_RPC_URL)
+        self.client = _wallet_client(self.config)
 
         # Import private key if provided
         self.private_key = None
         self.address = None
+        self._address_str = None
         if private_key_str:
             self.address = self.import_private_key(private_key_str)
             logger.info(f"Wallet initialized with address: {self.address}")
@@ -71,6 +141,8 @@ class WalletService:
 
             # Get the keypair from config
             self.private_key = self.config.keypair_for_address(address)
+            # Canonical (lowercase hex) form, computed once per import
+            self._address_str = str(address).lower()
             logger.info(f"Private key imported successfully for address: {address}")
 
             return address
@@ -82,8 +154,9 @@ class WalletService:
     async def build_and_execute_transfer(
         self,
         recipient: str,
-        amount: str,
-        token_type: TokenType = TokenType.SUI
+        amount: Union[int, float, str],
+        token_type: TokenType = TokenType.SUI,
+        use_gas_object: Optional[str] = None
     ) -> TransactionResult:
         """
         Build AND execute a transfer transaction using the imported wallet.
@@ -93,20 +166,31 @@ class WalletService:
 
         Args:
             recipient: Recipient's wallet address
-            amount: Amount in smallest units (MIST for SUI)
+            amount: Amount in smallest units (MIST for SUI), as an int, an
+                integral float or a base-10 integer string
             token_type: Type of token to transfer
+            use_gas_object: Coin object ID to pay gas (and split the amount)
+                from; by default pysui queries the wallet's coins and picks
 
         Returns:
-            TransactionResult with real transaction digest and effects
+            TransactionResult with real transaction digest and effects; a
+            negative or fractional amount yields success=False without
+            touching the chain
         """
         logger.info(f"Building and executing transfer: {amount} {token_type.value} to {recipient}")
+
+        amount_int = _parse_amount(amount)
+        if amount_int is None:
+            return TransactionResult(
+                success=False,
+                error=f"Invalid amount: {amount!r} (expected a non-negative integer in smallest units)"
+            )
         
         try:
             if not self.private_key or not self.address:
                 raise ValueError("No private key imported. Import a private key first.")
 
-            recipient_address = SuiAddress(recipient)
-            amount_int = int(amount)
+            recipient_address = _sui_address(recipient)
             
             logger.debug(f"Sender: {self.address}")
             logger.debug(f"Recipient: {recipient_address}")
@@ -138,7 +222,10 @@ class WalletService:
 
             # Execute the transaction
             logger.info("Executing transaction on blockchain...")
-            result = txn.execute(gas_budget=10000000)  # 0.01 SUI max gas
+            result = txn.execute(
+                gas_budget=TRANSFER_GAS_BUDGET,
+                use_gas_object=use_gas_object
+            )
 
             if result.is_ok():
                 tx_data = result.result_data
@@ -168,6 +255,69 @@ class WalletService:
             )
 
 
+    async def transfer_with_balance_check(
+        self,
+        recipient: str,
+        amount: Union[int, float, str],
+        token_type: TokenType = TokenType.SUI
+    ) -> TransactionResult:
+        """
+        Check the balance and execute a SUI transfer off a single coin query
+
+        The gas coins fetched for the balance check are reused to pick the
+        gas/split coin, instead of a separate get_balance() call followed by
+        pysui querying the same coins again while building the transaction.
+
+        Args:
+            recipient: Recipient's wallet address
+            amount: Amount in smallest units (MIST), as an int, an integral
+                float or a base-10 integer string
+            token_type: Type of token to transfer
+
+        Returns:
+            TransactionResult; success=False without submitting anything if
+            the balance can't cover amount + gas budget
+        """
+        amount_int = _parse_amount(amount)
+        if amount_int is None or token_type != TokenType.SUI or not self.address:
+            # Nothing to pre-check, let the regular path report the problem
+            return await self.build_and_execute_transfer(recipient, amount, token_type)
+
+        try:
+            result = self.client.get_gas(_sui_address(self._address_str))
+            if not result.is_ok():
+                raise ValueError(f"Failed to get balance: {result.result_string}")
+            coins = result.result_data.data
+        except Exception as e:
+            logger.error(f"Error in transfer_with_balance_check: {str(e)}", exc_info=True)
+            return TransactionResult(
+                success=False,
+                error=f"Transaction error: {str(e)}"
+            )
+
+        required = amount_int + TRANSFER_GAS_BUDGET
+        balances = list(map(int, map(_coin_balance, coins)))
+        total_balance = sum(balances)
+        if total_balance < required:
+            return TransactionResult(
+                success=False,
+                error=f"Insufficient balance: have {total_balance} MIST, need {required} MIST (amount + gas budget)"
+            )
+
+        # One coin covering amount + gas can be handed to pysui directly;
+        # otherwise leave it to pysui to merge coins
+        richest = max(range(len(balances)), key=balances.__getitem__)
+        use_gas_object = (
+            coins[richest].coin_object_id if balances[richest] >= required else None
+        )
+
+        return await self.build_and_execute_transfer(
+            recipient,
+            amount_int,
+            token_type,
+            use_gas_object=use_gas_object
+        )
+
     async def sign_and_execute_transaction(
         self,
         transaction_bytes: bytes,
@@ -190,10 +340,10 @@ class WalletService:
                 raise ValueError("No private key imported. Call import_private_key first.")
 
             # Verify sender address matches wallet
-            if str(self.address) != sender_address:
+            if self._address_str != sender_address.lower():
                 raise ValueError(
                     f"Sender address mismatch. "
-                    f"Wallet: {str(self.address)}, Sender: {sender_address}"
+                    f"Wallet: {self._address_str}, Sender: {sender_address}"
                 )
 
             # Sign transaction
@@ -243,18 +393,20 @@ class WalletService:
             if address is None:
                 if not self.address:
                     raise ValueError("No address provided and no wallet loaded")
-                address = str(self.address)  # Convert SuiString to string
+                address = self._address_str
 
-            sui_address = SuiAddress(address)
+            sui_address = _sui_address(address)
             result = self.client.get_gas(sui_address)
 
             if result.is_ok():
-                total_balance = sum(int(coin.balance) for coin in result.result_data.data)
+                coins = result.result_data.data
+                # map/attrgetter keep the per-coin loop in C (no generator frame)
+                total_balance = sum(map(int, map(_coin_balance, coins)))
                 return {
                     "address": address,
                     "balance_mist": total_balance,
                     "balance_sui": total_balance / 1_000_000_000,
-                    "coin_count": len(result.result_data.data)
+                    "coin_count": len(coins)
                 }
             else:
                 raise ValueError(f"Failed to get balance: {result.result_string}")
@@ -17,15 +17,32 @@ WHY WALRUS?
 - Privacy-compatible: Perfect for encrypted data storage
 """
 
+import asyncio
 import httpx
-import json
 import logging
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
+import orjson
 from config import settings
 from models.schemas import WalrusUploadResponse
+from utils import TTLCache
+
+# Blobs at least this large are streamed to the publisher in chunks
+STREAM_UPLOAD_THRESHOLD = 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# HEAD results are reused this long, so availability + metadata polling of
+# the same blob costs one request
+HEAD_CACHE_TTL = 2.0
+
+
+async def _iter_chunks(data: bytes, size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[memoryview]:
+    """Yield zero-copy slices of data for a streamed request body"""
+    view = memoryview(data)
+    for start in range(0, len(view), size):
+        yield view[start:start + size]
 
 
 class WalrusService:
@@ -39,7 +56,39 @@ class WalrusService:
     def __init__(self):
         self.publisher_url = settings.WALRUS_PUBLISHER_URL
         self.aggregator_url = settings.WALRUS_AGGREGATOR_URL
+        # Endpoint URLs built once; per-blob URLs only append the blob ID
+        self._pub_blobs_url = f"{self.publisher_url}/v1/blobs"
+        self._aggr_prefix = f"{self.aggregator_url}/v1/"
+        self._octet_headers = {"Content-Type": "application/octet-stream"}
         self.default_epochs = 5  # Storage duration in epochs (~2 weeks per epoch)
+        # Shared keep-alive client, created on first use (see _get_client)
+        self._client: Optional[httpx.AsyncClient] = None
+        # blob_id -> (status_code, headers) of the latest HEAD (see _head)
+        self._head_cache = TTLCache(ttl=HEAD_CACHE_TTL, max_size=1024)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP/2 client for publisher/aggregator requests
+
+        Reusing one client skips DNS + TCP + TLS setup on every blob operation
+        and lets concurrent requests share connections.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=settings.WALRUS_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.WALRUS_MAX_KEEPALIVE
+                )
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called from the app lifespan)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def upload_blob(
         self,
@@ -65,47 +114,55 @@ class WalrusService:
         """
         epochs = epochs or self.default_epochs
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Walrus Publisher API endpoint for storing blobs
-            url = f"{self.publisher_url}/v1/blobs"
-
-            # Upload parameters
-            params = {
-                "epochs": epochs
-            }
-
-            # Upload the blob
-            response = await client.put(
-                url,
-                params=params,
-                content=data,
-                headers={
-                    "Content-Type": "application/octet-stream"
-                }
-            )
+        client = self._get_client()
 
-            response.raise_for_status()
+        # Walrus Publisher API endpoint for storing blobs
+        url = self._pub_blobs_url
 
-            # Parse response
-            result = response.json()
-
-            # Walrus returns different formats, handle both
-            if "newlyCreated" in result:
-                blob_info = result["newlyCreated"]["blobObject"]
-                blob_id = blob_info["blobId"]
-                size = blob_info["size"]
-            elif "alreadyCertified" in result:
-                blob_info = result["alreadyCertified"]["blobObject"]
-                blob_id = blob_info["blobId"]
-                size = blob_info["size"]
-            else:
-                raise ValueError(f"Unexpected Walrus response format: {result}")
+        # Upload parameters
+        params = {
+            "epochs": epochs
+        }
 
-            return WalrusUploadResponse(
-                blob_id=blob_id,
-                size=int(size),
-                epochs=epochs
-            )
+        # Upload the blob; large blobs are streamed so the send is chunked
+        # instead of handing the whole buffer to the transport at once
+        if len(data) >= STREAM_UPLOAD_THRESHOLD:
+            content = _iter_chunks(data)
+            headers = {
+                **self._octet_headers,
+                "Content-Length": str(len(data))
+            }
+        else:
+            content = data
+            headers = self._octet_headers
+
+        response = await client.put(
+            url,
+            params=params,
+            content=content,
+            headers=headers
+        )
+
+        response.raise_for_status()
+
+        # Parse response
+        result = orjson.loads(response.content)
+
+        # Walrus returns different formats (newlyCreated / alreadyCertified),
+        # both wrapping the same blobObject
+        container = result.get("newlyCreated") or result.get("alreadyCertified")
+        if container is None:
+            raise ValueError(f"Unexpected Walrus response format: {result}")
+
+        blob_info = container["blobObject"]
+        blob_id = blob_info["blobId"]
+        size = int(blob_info["size"])
+
+        return WalrusUploadResponse(
+            blob_id=blob_id,
+            size=size,
+            epochs=epochs
+        )
 
     async def download_blob(self, blob_id: str) -> bytes:
         """
@@ -125,19 +182,74 @@ class WalrusService:
             httpx.HTTPError: If download fails
             ValueError: If blob not found
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Walrus Aggregator API endpoint for reading blobs
-            url = f"{self.aggregator_url}/v1/{blob_id}"
+        client = self._get_client()
 
-            response = await client.get(url)
+        # Walrus Aggregator API endpoint for reading blobs
+        url = self._aggr_prefix + blob_id
 
-            if response.status_code == 404:
-                raise ValueError(f"Blob not found: {blob_id}")
+        response = await client.get(url)
 
-            response.raise_for_status()
+        if response.status_code == 404:
+            raise ValueError(f"Blob not found: {blob_id}")
+
+        response.raise_for_status()
+
+        return response.content
+
+    async def download_blobs(
+        self,
+        blob_ids: List[str],
+        concurrency: int = 32
+    ) -> List[Optional[bytes]]:
+        """
+        Download several encrypted blobs concurrently
+
+        Requests share the pooled client and are bounded by a semaphore so a
+        large batch doesn't overwhelm the aggregator.
+
+        Args:
+            blob_ids: Blob IDs from previous uploads
+            concurrency: Max in-flight requests
+
+        Returns:
+            Encrypted bytes for each blob ID, in order (None if not found)
+
+        Raises:
+            httpx.HTTPError: If any download fails for a reason other than 404
+        """
+        client = self._get_client()
+        semaphore = asyncio.Semaphore(concurrency)
 
+        async def _download(blob_id: str) -> Optional[bytes]:
+            async with semaphore:
+                response = await client.get(self._aggr_prefix + blob_id)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
             return response.content
 
+        return list(await asyncio.gather(*(_download(b) for b in blob_ids)))
+
+    async def _head(self, blob_id: str) -> Tuple[int, Dict[str, str]]:
+        """
+        HEAD a blob on the aggregator, reusing a result younger than HEAD_CACHE_TTL
+
+        Returns:
+            (status_code, response headers)
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        cached = self._head_cache.get(blob_id)
+        if cached is not None:
+            return cached
+
+        client = self._get_client()
+        response = await client.head(self._aggr_prefix + blob_id, timeout=10.0)
+        result = (response.status_code, dict(response.headers))
+        self._head_cache.set(blob_id, result)
+        return result
+
     async def check_blob_availability(self, blob_id: str) -> bool:
         """
         Check if a blob exists and is available on Walrus
@@ -149,10 +261,8 @@ class WalrusService:
             True if blob exists and is accessible
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                url = f"{self.aggregator_url}/v1/{blob_id}"
-                response = await client.head(url)
-                return response.status_code == 200
+            status_code, _ = await self._head(blob_id)
+            return status_code == 200
         except Exception:
             return False
 
@@ -170,22 +280,20 @@ class WalrusService:
             Dictionary with available metadata
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                url = f"{self.aggregator_url}/v1/{blob_id}"
-                response = await client.head(url)
-
-                if response.status_code == 200:
-                    return {
-                        "blob_id": blob_id,
-                        "available": True,
-                        "size": response.headers.get("content-length"),
-                        "content_type": response.headers.get("content-type")
-                    }
-                else:
-                    return {
-                        "blob_id": blob_id,
-                        "available": False
-                    }
+            status_code, headers = await self._head(blob_id)
+
+            if status_code == 200:
+                return {
+                    "blob_id": blob_id,
+                    "available": True,
+                    "size": headers.get("content-length"),
+                    "content_type": headers.get("content-type")
+                }
+            else:
+                return {
+                    "blob_id": blob_id,
+                    "available": False
+                }
         except Exception as e:
             return {
                 "blob_id": blob_id,
@@ -1,8 +1,12 @@
 """
 Test script to verify AddressBook on-chain
 """
+import atexit
+
 import httpx
-import json
+import orjson
+
+_PRETTY_JSON = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 # Configuration
 SUI_RPC_URL = "https://fullnode.testnet.sui.io:443"
@@ -11,11 +15,14 @@ PACKAGE_ID = "0x8e385abb2ccefc0aed625567e72c8005f06ae3a97d534a25cb8e5dd2b62f6f9c
 # Replace with your wallet address
 USER_ADDRESS = "0x6d2214052b18cc9ff2f97cb904343a47ab9d85453e45e9477197e75eab365eac"
 
-def get_all_owned_objects(address: str):
-    """Get all objects owned by address"""
-    payload = {
+ADDRESS_BOOK_TYPE = f"{PACKAGE_ID}::address_book::AddressBook"
+
+
+def get_all_owned_objects_payload(address: str, request_id: int = 1):
+    """JSON-RPC request for all objects owned by address"""
+    return {
         "jsonrpc": "2.0",
-        "id": 1,
+        "id": request_id,
         "method": "suix_getOwnedObjects",
         "params": [
             address,
@@ -29,24 +36,17 @@ def get_all_owned_objects(address: str):
         ]
     }
 
-    response = httpx.post(SUI_RPC_URL, json=payload, timeout=10.0)
-    return response.json()
-
-def get_address_book_objects(address: str):
-    """Get AddressBook objects owned by address"""
-    address_book_type = f"{PACKAGE_ID}::address_book::AddressBook"
-
-    print(f"Looking for type: {address_book_type}")
-
-    payload = {
+def get_address_book_objects_payload(address: str, request_id: int = 2):
+    """JSON-RPC request for AddressBook objects owned by address"""
+    return {
         "jsonrpc": "2.0",
-        "id": 1,
+        "id": request_id,
         "method": "suix_getOwnedObjects",
         "params": [
             address,
             {
                 "filter": {
-                    "StructType": address_book_type
+                    "StructType": ADDRESS_BOOK_TYPE
                 },
                 "options": {
                     "showType": True,
@@ -57,17 +57,65 @@ def get_address_book_objects(address: str):
         ]
     }
 
-    response = httpx.post(SUI_RPC_URL, json=payload, timeout=10.0)
-    return response.json()
+# The batch body only varies by address: serialize it once with a
+# placeholder and substitute the (JSON-encoded) address per call
+_ADDRESS_PLACEHOLDER = "__ADDRESS__"
+_OWNED_OBJECTS_BATCH_TEMPLATE = orjson.dumps([
+    get_all_owned_objects_payload(_ADDRESS_PLACEHOLDER, 1),
+    get_address_book_objects_payload(_ADDRESS_PLACEHOLDER, 2)
+])
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# One pooled client for all RPC calls: the TLS connection to the fullnode is
+# set up once and (over HTTP/2) multiplexed across requests
+_RPC_CLIENT = httpx.Client(
+    http2=_HTTP2,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=8)
+)
+atexit.register(_RPC_CLIENT.close)
+
+def rpc_batch(client: httpx.Client, body: bytes, request_ids: list):
+    """
+    Send several pre-serialized JSON-RPC requests in one HTTP round-trip
+
+    Returns a dict of request id -> response
+    """
+    response = client.post(SUI_RPC_URL, content=body, headers=_JSON_HEADERS)
+    results = orjson.loads(response.content)
+    if isinstance(results, dict):
+        # Transport-level error for the whole batch
+        return {request_id: results for request_id in request_ids}
+    return {r.get("id"): r for r in results}
+
+def get_owned_and_address_book_objects(address: str):
+    """Get all owned objects and AddressBook objects with one batched request"""
+    print(f"Looking for type: {ADDRESS_BOOK_TYPE}")
+
+    body = _OWNED_OBJECTS_BATCH_TEMPLATE.replace(
+        orjson.dumps(_ADDRESS_PLACEHOLDER), orjson.dumps(address)
+    )
+    responses = rpc_batch(_RPC_CLIENT, body, [1, 2])
+
+    missing = {"error": "No response for request"}
+    return responses.get(1, missing), responses.get(2, missing)
 
 if __name__ == "__main__":
     print("=" * 60)
     print(f"Checking AddressBook for: {USER_ADDRESS}")
     print("=" * 60)
 
+    # Both queries go out in a single JSON-RPC batch
+    all_objects, address_books = get_owned_and_address_book_objects(USER_ADDRESS)
+
     # First get all objects
     print("\n1. Getting ALL owned objects...")
-    all_objects = get_all_owned_objects(USER_ADDRESS)
 
     if "result" in all_objects:
         data = all_objects["result"].get("data", [])
@@ -82,7 +130,6 @@ if __name__ == "__main__":
 
     # Now filter for AddressBook
     print("\n2. Filtering for AddressBook type...")
-    address_books = get_address_book_objects(USER_ADDRESS)
 
     if "result" in address_books:
         data = address_books["result"].get("data", [])
@@ -93,7 +140,7 @@ if __name__ == "__main__":
             print(f"\n   AddressBook found:")
             print(f"   - Object ID: {obj_data.get('objectId')}")
             print(f"   - Type: {obj_data.get('type')}")
-            print(f"   - Content: {json.dumps(obj_data.get('content'), indent=4)}")
+            print(f"   - Content: {orjson.dumps(obj_data.get('content'), option=_PRETTY_JSON).decode()}")
     else:
         print(f"   Error: {address_books.get('error')}")
 
@@ -4,10 +4,14 @@ Tests all endpoints and writes results to a log file
 """
 
 import httpx
-import json
 import asyncio
+import io
 from datetime import datetime
 
+import orjson
+
+_PRETTY_JSON = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 BASE_URL = "http://localhost:8000/api/v1"
 OUTPUT_FILE = "test_results.txt"
 
@@ -15,20 +19,24 @@ OUTPUT_FILE = "test_results.txt"
 TEST_USER_ADDRESS = "0xtest_user_123456789"
 TEST_CONTACT_ADDRESS = "0xalice_contact_address_abc"
 
+_BAR = "=" * 60
+
+
 async def log_result(f, test_name: str, status: str, response: dict = None, error: str = None):
     """Log test result to file and console"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    result = f"\n{'='*60}\n"
-    result += f"[{timestamp}] TEST: {test_name}\n"
-    result += f"STATUS: {status}\n"
-    
+    timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
+    parts = [
+        f"\n{_BAR}\n",
+        f"[{timestamp}] TEST: {test_name}\n",
+        f"STATUS: {status}\n",
+    ]
     if response:
-        result += f"RESPONSE:\n{json.dumps(response, indent=2, ensure_ascii=False)}\n"
+        parts.append(f"RESPONSE:\n{orjson.dumps(response, option=_PRETTY_JSON).decode()}\n")
     if error:
-        result += f"ERROR: {error}\n"
-    
-    result += f"{'='*60}\n"
-    
+        parts.append(f"ERROR: {error}\n")
+    parts.append(f"{_BAR}\n")
+
+    result = "".join(parts)
     print(result)
     f.write(result)
 
@@ -37,7 +45,7 @@ async def test_health(client, f):
     """Test 1: Health Check"""
     try:
         response = await client.get(f"{BASE_URL}/health")
-        data = response.json()
+        data = orjson.loads(response.content)
         await log_result(f, "Health Check", "✅ PASS", response=data)
         return True
     except Exception as e:
@@ -53,7 +61,7 @@ async def test_chat_balance_query(client, f):
             "user_address": TEST_USER_ADDRESS
         }
         response = await client.post(f"{BASE_URL}/chat", json=payload)
-        data = response.json()
+        data = orjson.loads(response.content)
         await log_result(f, "Chat - Balance Query", "✅ PASS", response=data)
         return True
     except Exception as e:
@@ -69,7 +77,7 @@ async def test_chat_transfer_intent(client, f):
             "user_address": TEST_USER_ADDRESS
         }
         response = await client.post(f"{BASE_URL}/chat", json=payload)
-        data = response.json()
+        data = orjson.loads(response.content)
         await log_result(f, "Chat - Transfer Intent", "✅ PASS", response=data)
         return True
     except Exception as e:
@@ -85,7 +93,7 @@ async def test_chat_ambiguous_message(client, f):
             "user_address": TEST_USER_ADDRESS
         }
         response = await client.post(f"{BASE_URL}/chat", json=payload)
-        data = response.json()
+        data = orjson.loads(response.content)
         await log_result(f, "Chat - Ambiguous Message", "✅ PASS", response=data)
         return True
     except Exception as e:
@@ -101,7 +109,7 @@ async def test_chat_contact_name_transfer(client, f):
             "user_address": TEST_USER_ADDRESS
         }
         response = await client.post(f"{BASE_URL}/chat", json=payload)
-        data = response.json()
+        data = orjson.loads(response.content)
         await log_result(f, "Chat - Transfer to Contact Name", "✅ PASS", response=data)
         return True
     except Exception as e:
@@ -119,7 +127,7 @@ async def test_contacts_save(client, f):
             "notes": "Test contact"
         }
         response = await client.post(f"{BASE_URL}/contacts/save", json=payload)
-        data = response.json()
+        data = orjson.loads(response.content)
         status = "✅ PASS" if response.status_code == 200 else f"⚠️ STATUS {response.status_code}"
         await log_result(f, "Contacts - Save", status, response=data)
         return response.status_code == 200
@@ -129,11 +137,27 @@ async def test_contacts_save(client, f):
 
 
 async def test_contacts_list(client, f):
-    """Test 7: List Contacts"""
+    """Test 7: List Contacts (then revalidate it with If-None-Match)"""
+    url = f"{BASE_URL}/contacts/list"
+    params = {"user_address": TEST_USER_ADDRESS}
     try:
-        response = await client.get(f"{BASE_URL}/contacts/list", params={"user_address": TEST_USER_ADDRESS})
-        data = response.json()
-        await log_result(f, "Contacts - List", "✅ PASS", response=data)
+        response = await client.get(url, params=params)
+        data = orjson.loads(response.content)
+        etag = response.headers.get("etag")
+        if etag is None:
+            await log_result(f, "Contacts - List", "❌ FAIL", response=data, error="No ETag header")
+            return False
+
+        # Nothing changed since the first GET, so the server must answer 304
+        revalidated = await client.get(url, params=params, headers={"If-None-Match": etag})
+        if revalidated.status_code != 304:
+            await log_result(
+                f, "Contacts - List", "❌ FAIL", response=data,
+                error=f"Expected 304 for If-None-Match {etag}, got {revalidated.status_code}"
+            )
+            return False
+
+        await log_result(f, "Contacts - List", "✅ PASS (304 on revalidation)", response=data)
         return True
     except Exception as e:
         await log_result(f, "Contacts - List", "❌ FAIL", error=str(e))
@@ -153,7 +177,7 @@ async def test_execute_without_key(client, f):
             }
         }
         response = await client.post(f"{BASE_URL}/execute", json=payload)
-        data = response.json()
+        data = orjson.loads(response.content)
         # This should fail because no private key
         status = "✅ PASS (Expected rejection)" if response.status_code >= 400 else "⚠️ Unexpected success"
         await log_result(f, "Execute - No Private Key", status, response=data)
@@ -171,7 +195,7 @@ async def test_chat_stake_intent(client, f):
             "user_address": TEST_USER_ADDRESS
         }
         response = await client.post(f"{BASE_URL}/chat", json=payload)
-        data = response.json()
+        data = orjson.loads(response.content)
         await log_result(f, "Chat - Stake Intent", "✅ PASS", response=data)
         return True
     except Exception as e:
@@ -187,7 +211,7 @@ async def test_chat_usdc_balance(client, f):
             "user_address": TEST_USER_ADDRESS
         }
         response = await client.post(f"{BASE_URL}/chat", json=payload)
-        data = response.json()
+        data = orjson.loads(response.content)
         await log_result(f, "Chat - USDC Balance", "✅ PASS", response=data)
         return True
     except Exception as e:
@@ -197,47 +221,76 @@ async def test_chat_usdc_balance(client, f):
 
 async def run_all_tests():
     """Run all API tests"""
-    print("\n" + "="*60)
+    print("\n" + _BAR)
     print("  BLOCKCHAIN AI AGENT - API TEST SUITE")
-    print("="*60 + "\n")
+    print(_BAR + "\n")
     
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        f.write("BLOCKCHAIN AI AGENT - API TEST RESULTS\n")
-        f.write(f"Test Run: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Base URL: {BASE_URL}\n")
-        f.write("="*60 + "\n")
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            results = []
-            
-            # Run all tests
-            results.append(("Health Check", await test_health(client, f)))
-            results.append(("Balance Query", await test_chat_balance_query(client, f)))
-            results.append(("Transfer Intent", await test_chat_transfer_intent(client, f)))
-            results.append(("Ambiguous Message", await test_chat_ambiguous_message(client, f)))
-            results.append(("Contact Name Transfer", await test_chat_contact_name_transfer(client, f)))
-            results.append(("Save Contact", await test_contacts_save(client, f)))
-            results.append(("List Contacts", await test_contacts_list(client, f)))
-            results.append(("Execute No Key", await test_execute_without_key(client, f)))
-            results.append(("Stake Intent", await test_chat_stake_intent(client, f)))
-            results.append(("USDC Balance", await test_chat_usdc_balance(client, f)))
-            
-            # Summary
-            passed = sum(1 for _, r in results if r)
-            failed = len(results) - passed
-            
-            summary = f"\n{'='*60}\n"
-            summary += f"TEST SUMMARY\n"
-            summary += f"{'='*60}\n"
-            summary += f"Total Tests: {len(results)}\n"
-            summary += f"Passed: {passed} ✅\n"
-            summary += f"Failed: {failed} ❌\n"
-            summary += f"Success Rate: {(passed/len(results)*100):.1f}%\n"
-            summary += f"{'='*60}\n"
-            
-            print(summary)
-            f.write(summary)
+    # Log entries are collected in memory and written to OUTPUT_FILE in one go
+    # at the end, so no disk IO blocks the event loop while tests are running
+    f = io.StringIO()
+    f.write("BLOCKCHAIN AI AGENT - API TEST RESULTS\n")
+    f.write(f"Test Run: {datetime.now().isoformat(sep=' ', timespec='seconds')}\n")
+    f.write(f"Base URL: {BASE_URL}\n")
+    f.write(_BAR + "\n")
     
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    ) as client:
+        async def contacts_flow():
+            # List depends on save, so it chains after it instead of
+            # waiting for every other test to finish
+            saved = await test_contacts_save(client, f)
+            listed = await test_contacts_list(client, f)
+            return saved, listed
+
+        # Independent tests run concurrently (log_result never awaits
+        # mid-write, so entries don't interleave and need no lock)
+        async with asyncio.TaskGroup() as tg:
+            health = tg.create_task(test_health(client, f))
+            balance = tg.create_task(test_chat_balance_query(client, f))
+            transfer = tg.create_task(test_chat_transfer_intent(client, f))
+            ambiguous = tg.create_task(test_chat_ambiguous_message(client, f))
+            contact_transfer = tg.create_task(test_chat_contact_name_transfer(client, f))
+            contacts = tg.create_task(contacts_flow())
+            execute_no_key = tg.create_task(test_execute_without_key(client, f))
+            stake = tg.create_task(test_chat_stake_intent(client, f))
+            usdc = tg.create_task(test_chat_usdc_balance(client, f))
+
+        save_contact, list_contacts = contacts.result()
+
+        results = [
+            ("Health Check", health.result()),
+            ("Balance Query", balance.result()),
+            ("Transfer Intent", transfer.result()),
+            ("Ambiguous Message", ambiguous.result()),
+            ("Contact Name Transfer", contact_transfer.result()),
+            ("Save Contact", save_contact),
+            ("List Contacts", list_contacts),
+            ("Execute No Key", execute_no_key.result()),
+            ("Stake Intent", stake.result()),
+            ("USDC Balance", usdc.result()),
+        ]
+        
+        # Summary
+        passed = sum(1 for _, r in results if r)
+        failed = len(results) - passed
+        
+        summary = f"\n{_BAR}\n"
+        summary += f"TEST SUMMARY\n"
+        summary += f"{_BAR}\n"
+        summary += f"Total Tests: {len(results)}\n"
+        summary += f"Passed: {passed} ✅\n"
+        summary += f"Failed: {failed} ❌\n"
+        summary += f"Success Rate: {(passed/len(results)*100):.1f}%\n"
+        summary += f"{_BAR}\n"
+        
+        print(summary)
+        f.write(summary)
+
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as out:
+        out.write(f.getvalue())
+
     print(f"\n📄 Results saved to: {OUTPUT_FILE}")
 
 
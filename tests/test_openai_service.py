@@ -0,0 +1,92 @@
+"""
+Unit tests for the OpenAI fast path error handling (no network access)
+
+Run with: python -m unittest discover tests
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import httpx
+from openai import APIStatusError
+from tenacity import wait_none
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("SECRET_KEY", "test")
+
+# Load the module by path: importing the services package would construct
+# every service singleton (and hit the Sui RPC node)
+_spec = importlib.util.spec_from_file_location(
+    "openai_service_under_test", ROOT / "services" / "openai_service.py"
+)
+openai_service = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(openai_service)
+
+MESSAGES = [{"role": "user", "content": "What is my SUI balance?"}]
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [{
+        "index": 0,
+        "finish_reason": "stop",
+        "message": {"role": "assistant", "content": "ok"}
+    }]
+}
+
+PROXY_502 = b"<html><body><h1>502 Bad Gateway</h1></body></html>"
+
+
+class FastPathTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(openai_service.settings, "OPENAI_FAST_PATH", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = openai_service.OpenAIService()
+        # Same retry policy, without the backoff sleeps
+        self.call_llm = openai_service.OpenAIService._call_llm.retry_with(wait=wait_none())
+
+    def _serve(self, *responses):
+        """Answer fast-path requests with responses, in order"""
+        queue = list(responses)
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            return queue.pop(0)
+
+        self.service._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.addCleanup(lambda: asyncio.run(self.service._http.aclose()))
+
+    def test_non_json_502_is_retried(self):
+        self._serve(
+            httpx.Response(502, content=PROXY_502, headers={"Content-Type": "text/html"}),
+            httpx.Response(200, json=COMPLETION)
+        )
+
+        completion = asyncio.run(self.call_llm(self.service, MESSAGES))
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(completion.choices[0].message.content, "ok")
+
+    def test_non_json_error_raises_status_error(self):
+        self._serve(httpx.Response(400, content=b"Bad Request"))
+
+        with self.assertRaises(APIStatusError) as ctx:
+            asyncio.run(self.service._post_completion(MESSAGES))
+
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(ctx.exception.message, "HTTP 400")
+
+
+if __name__ == "__main__":
+    unittest.main()
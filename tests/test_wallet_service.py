@@ -0,0 +1,103 @@
+"""
+Unit tests for WalletService key handling (no network access)
+
+Run with: python -m unittest discover tests
+"""
+
+import base64
+import importlib.util
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("SECRET_KEY", "test")
+
+# Load the module by path: importing the services package would construct
+# every service singleton (and hit the Sui RPC node)
+_spec = importlib.util.spec_from_file_location(
+    "wallet_service_under_test", ROOT / "services" / "wallet_service.py"
+)
+wallet_service = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(wallet_service)
+
+from pysui import SyncClient
+from pysui.sui.sui_txn.signing_ms import SignerBlock
+
+# Throwaway testnet keys (same as test_real_transactions.py)
+PRIVATE_KEY = "suiprivkey1qzw4ak32zhgnn25ns2taccem79dnqhzm3z6hy2370f84cefnf837qltw4pn"
+ADDRESS = "0x6d6ea71aeb3029760347ecee4cd7472af79a7d9ec1c9205ef123e726206aec69"
+OTHER_PRIVATE_KEY = "suiprivkey1qpath2ypct6ywcvmqz92mypv55p08ld0kj98lm79a77j53xezqack3ca88m"
+
+TX_BYTES = base64.b64encode(b"wallet service signing test").decode()
+
+
+class WalletServiceKeyTests(unittest.TestCase):
+    def setUp(self):
+        # Real SyncClients, minus the RPC descriptor fetch that needs the node
+        patcher = mock.patch.object(SyncClient, "_fetch_common_descriptors")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        wallet_service._shared_sync_client.cache_clear()
+        self.addCleanup(wallet_service._shared_sync_client.cache_clear)
+
+    def test_same_key_twice(self):
+        first = wallet_service.WalletService(PRIVATE_KEY)
+        second = wallet_service.WalletService(PRIVATE_KEY)
+
+        self.assertEqual(str(first.address), ADDRESS)
+        self.assertEqual(str(second.address), ADDRESS)
+
+    def test_wallets_do_not_share_keys(self):
+        wallet = wallet_service.WalletService(PRIVATE_KEY)
+        empty = wallet_service.WalletService()
+
+        self.assertIs(wallet.client.config, wallet.config)
+        self.assertIn(ADDRESS, wallet.config.addresses)
+        self.assertNotIn(ADDRESS, empty.config.addresses)
+
+    def test_wallets_share_the_transport(self):
+        first = wallet_service.WalletService(PRIVATE_KEY)
+        second = wallet_service.WalletService(OTHER_PRIVATE_KEY)
+
+        shared = wallet_service._shared_sync_client(first.config.rpc_url)
+        self.assertIsNot(first.client, second.client)
+        self.assertIs(first.client._client, shared._client)
+        self.assertIs(second.client._client, shared._client)
+
+    def test_signing_uses_the_wallets_keypair(self):
+        wallet = wallet_service.WalletService(PRIVATE_KEY)
+        other = wallet_service.WalletService(OTHER_PRIVATE_KEY)
+
+        # The same lookup pysui's transaction execute() signs with
+        signatures = SignerBlock(sender=wallet.address).get_signatures(
+            client=wallet.client, tx_bytes=TX_BYTES
+        )
+        expected = wallet.private_key.new_sign_secure(TX_BYTES)
+        self.assertEqual(signatures.array[0].value, expected.value)
+
+        # The other wallet's client has no keypair for this address
+        with self.assertRaises(ValueError):
+            SignerBlock(sender=wallet.address).get_signatures(
+                client=other.client, tx_bytes=TX_BYTES
+            )
+
+
+class ParseAmountTests(unittest.TestCase):
+    def test_accepted(self):
+        self.assertEqual(wallet_service._parse_amount(1000), 1000)
+        self.assertEqual(wallet_service._parse_amount("1000"), 1000)
+        self.assertEqual(wallet_service._parse_amount(1e9), 1_000_000_000)
+
+    def test_rejected(self):
+        for amount in (-1, "-1", "1.5", "abc", 1.5, -2.0, float("nan"), True, None, [1]):
+            with self.subTest(amount=amount):
+                self.assertIsNone(wallet_service._parse_amount(amount))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,14 @@
+"""
+Utilities package for Sui Blockchain AI Agent
+"""
+
+from .helpers import RateLimiter, TTLCache, next_nonce, unix_seconds
+from .log_handlers import BufferedRotatingFileHandler
+
+__all__ = [
+    "RateLimiter",
+    "TTLCache",
+    "next_nonce",
+    "unix_seconds",
+    "BufferedRotatingFileHandler"
+]
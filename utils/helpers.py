@@ -0,0 +1,129 @@
+"""
+Shared helper utilities for Sui Blockchain AI Agent
+"""
+
+import itertools
+import os
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+# ============================================================================
+# Nonces
+# ============================================================================
+
+# 32-bit random prefix drawn once per process + 96-bit counter starting at a
+# random offset. Contact nonces only need to be unique (the timestamp stored
+# next to them provides freshness), so this avoids a getrandom() syscall per
+# request. Forked children (e.g. Gunicorn workers) reseed both, otherwise
+# every worker would continue the parent's sequence and issue the same nonces.
+_NONCE_COUNTER_MASK = (1 << 96) - 1
+
+
+def _seed_nonce() -> None:
+    """Draw a fresh nonce prefix and counter offset for this process"""
+    global _NONCE_PREFIX, _nonce_counter
+    _NONCE_PREFIX = os.urandom(4)
+    _nonce_counter = itertools.count(int.from_bytes(os.urandom(8), "big"))
+
+
+_seed_nonce()
+if hasattr(os, "register_at_fork"):  # not available on Windows (no fork)
+    os.register_at_fork(after_in_child=_seed_nonce)
+
+
+def next_nonce() -> bytes:
+    """Return a process-unique 16-byte nonce"""
+    return _NONCE_PREFIX + (next(_nonce_counter) & _NONCE_COUNTER_MASK).to_bytes(12, "big")
+
+
+def unix_seconds() -> int:
+    """Current Unix time in whole seconds (integer path, no float conversion)"""
+    return time.time_ns() // 1_000_000_000
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache with per-entry expiry
+
+    Entries expire `ttl` seconds after being set. When the cache holds
+    `max_size` entries, expired entries are purged first and then the oldest
+    insertions are evicted, so memory stays bounded.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value, or `default` if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for `ttl` seconds"""
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_size:
+                self._evict(now)
+            self._data[key] = (now + self.ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        """Invalidate a single key"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self, now: float) -> None:
+        # Drop expired entries, then the oldest ones if still full
+        for key in [k for k, (exp, _) in self._data.items() if exp < now]:
+            del self._data[key]
+        while len(self._data) >= self.max_size:
+            del self._data[next(iter(self._data))]
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket
+
+    Allows bursts of up to `rate` events and refills at `rate` tokens per
+    `per` seconds. `try_acquire` never blocks; callers decide what to do when
+    the bucket is empty.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.capacity = rate
+        self.fill_rate = rate / per
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one token if available, without waiting"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.fill_rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
@@ -0,0 +1,119 @@
+"""
+Logging handlers for Sui Blockchain AI Agent
+"""
+
+import logging
+import os
+import threading
+from logging.handlers import RotatingFileHandler
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that batches writes instead of flushing every record
+
+    The file is opened with a large write buffer and only flushed when the
+    buffer fills, every `flush_interval` seconds, on ERROR+ records and on
+    close. The stock handler also seeks/tells the stream before each record
+    to decide on rotation (which forces a flush), so the file size is tracked
+    in-process instead.
+    """
+
+    def __init__(
+        self,
+        filename,
+        mode="a",
+        maxBytes=0,
+        backupCount=0,
+        encoding=None,
+        delay=False,
+        errors=None,
+        buffer_size: int = 1 << 16,
+        flush_interval: float = 30.0
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._bytes_written = 0
+        super().__init__(
+            filename,
+            mode=mode,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+            errors=errors
+        )
+
+        # Periodic background flush so idle periods don't leave records in
+        # memory. Started on first emit, in the process that writes: a thread
+        # started before a fork (e.g. in a Gunicorn master) doesn't exist in
+        # the children
+        self._stop_flush = threading.Event()
+        self._flusher = None
+        self._flusher_pid = None
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+        self._bytes_written = os.path.getsize(self.baseFilename)
+        return stream
+
+    def _encoded_len(self, msg: str) -> int:
+        """Size of msg on disk, so maxBytes is compared against bytes, not characters"""
+        return len(msg.encode(self.encoding or "utf-8", self.errors or "strict"))
+
+    def shouldRollover(self, record) -> bool:
+        # Kept for API compatibility; emit() checks rollover on the message it
+        # already formatted instead of formatting the record twice
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        msg = self.format(record) + self.terminator
+        return self._bytes_written + self._encoded_len(msg) >= self.maxBytes
+
+    def emit(self, record):
+        try:
+            if self._flusher_pid != os.getpid():
+                self._start_flusher()
+            msg = self.format(record) + self.terminator
+            size = self._encoded_len(msg)
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += size
+            # Errors should hit the disk right away
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _start_flusher(self):
+        # Called with the handler lock held (Handler.handle), so at most one
+        # flusher is started per process
+        self._flusher_pid = os.getpid()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name=f"log-flush-{os.path.basename(self.baseFilename)}",
+            daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self):
+        while not self._stop_flush.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop_flush.set()
+        super().close()
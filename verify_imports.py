@@ -4,80 +4,64 @@ Import Verification Script
 Tests that all imports work correctly
 """
 
-import sys
+import importlib
+import multiprocessing
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # Add current directory to path (should already be there, but just in case)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def test_imports():
-    """Test all critical imports"""
-    errors = []
-
-    print("Testing imports...\n")
-
-    # Test config
-    try:
-        from config import settings
-        print("[OK] config.settings imported successfully")
-    except Exception as e:
-        errors.append(f"[ERR] config.settings: {e}")
-        print(f"[ERR] config.settings: {e}")
+# (module, attribute) pairs to import, in dependency order
+IMPORTS = (
+    ("config", "settings"),
+    ("models.schemas", "ChatRequest"),
+    ("services.openai_service", "openai_service"),
+    ("services.sui_service", "sui_service"),
+    ("services.walrus_service", "walrus_service"),
+    ("services.seal_service", "seal_service"),
+    ("routers.chat", "router"),
+    ("main", "app"),
+)
 
-    # Test models
+def probe(module_name: str, attr: str):
+    """Import one module in a worker process; returns an error message or None"""
     try:
-        from models.schemas import (
-            ChatRequest, ChatResponse, TokenType, IntentAction
-        )
-        print("[OK] models.schemas imported successfully")
+        getattr(importlib.import_module(module_name), attr)
+        return None
     except Exception as e:
-        errors.append(f"[ERR] models.schemas: {e}")
-        print(f"[ERR] models.schemas: {e}")
+        return str(e)
 
-    # Test services
-    try:
-        from services.openai_service import openai_service
-        print("[OK] services.openai_service imported successfully")
-    except Exception as e:
-        errors.append(f"[ERR] services.openai_service: {e}")
-        print(f"[ERR] services.openai_service: {e}")
-
-    try:
-        from services.sui_service import sui_service
-        print("[OK] services.sui_service imported successfully")
-    except Exception as e:
-        errors.append(f"[ERR] services.sui_service: {e}")
-        print(f"[ERR] services.sui_service: {e}")
+def test_imports():
+    """Test all critical imports"""
+    errors = []
 
-    try:
-        from services.walrus_service import walrus_service
-        print("[OK] services.walrus_service imported successfully")
-    except Exception as e:
-        errors.append(f"[ERR] services.walrus_service: {e}")
-        print(f"[ERR] services.walrus_service: {e}")
+    print("Testing imports...\n")
 
-    try:
-        from services.seal_service import seal_service
-        print("[OK] services.seal_service imported successfully")
-    except Exception as e:
-        errors.append(f"[ERR] services.seal_service: {e}")
-        print(f"[ERR] services.seal_service: {e}")
+    # Each import runs in a fresh spawned process (workers are never reused),
+    # so probes overlap and a module that fails, or leaves global state behind,
+    # can't affect the others
+    with ProcessPoolExecutor(
+        max_workers=min(8, len(IMPORTS)),
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1
+    ) as executor:
+        futures = [executor.submit(probe, module_name, attr) for module_name, attr in IMPORTS]
 
-    # Test routers
-    try:
-        from routers.chat import router
-        print("[OK] routers.chat imported successfully")
-    except Exception as e:
-        errors.append(f"[ERR] routers.chat: {e}")
-        print(f"[ERR] routers.chat: {e}")
+        for (module_name, attr), future in zip(IMPORTS, futures):
+            label = f"{module_name}.{attr}"
+            try:
+                error = future.result()
+            except Exception as e:
+                # Worker crashed before it could report
+                error = str(e)
 
-    # Test main app
-    try:
-        from main import app
-        print("[OK] main.app imported successfully")
-    except Exception as e:
-        errors.append(f"[ERR] main.app: {e}")
-        print(f"[ERR] main.app: {e}")
+            if error is None:
+                print(f"[OK] {label} imported successfully")
+            else:
+                errors.append(f"[ERR] {label}: {error}")
+                print(f"[ERR] {label}: {error}")
 
     # Summary
     print("\n" + "="*50)
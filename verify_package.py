@@ -1,17 +1,26 @@
 """
 Verify the address_book package exists on Sui testnet
 """
-import httpx
+import asyncio
 import json
+import os
+import time
+
+import httpx
 
 SUI_RPC_URL = "https://fullnode.testnet.sui.io:443"
 PACKAGE_ID = "0x8e385abb2ccefc0aed625567e72c8005f06ae3a97d534a25cb8e5dd2b62f6f9c"
 
-def get_object(object_id: str):
-    """Get object by ID"""
-    payload = {
+# Published packages are immutable, so successful responses are kept on disk
+# and reused across runs until they are CACHE_TTL seconds old
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sui_rpc_cache.json")
+CACHE_TTL = 24 * 3600
+
+def get_object_payload(object_id: str, request_id: int = 1):
+    """JSON-RPC request for an object by ID"""
+    return {
         "jsonrpc": "2.0",
-        "id": 1,
+        "id": request_id,
         "method": "sui_getObject",
         "params": [
             object_id,
@@ -23,29 +32,121 @@ def get_object(object_id: str):
         ]
     }
 
-    response = httpx.post(SUI_RPC_URL, json=payload, timeout=10.0)
-    return response.json()
-
-def get_normalized_module(package_id: str, module_name: str):
-    """Get normalized Move module"""
-    payload = {
+def get_normalized_module_payload(package_id: str, module_name: str, request_id: int = 2):
+    """JSON-RPC request for a normalized Move module"""
+    return {
         "jsonrpc": "2.0",
-        "id": 1,
+        "id": request_id,
         "method": "sui_getNormalizedMoveModule",
         "params": [package_id, module_name]
     }
 
-    response = httpx.post(SUI_RPC_URL, json=payload, timeout=10.0)
-    return response.json()
+async def rpc_batch(client: httpx.AsyncClient, payloads: list):
+    """
+    Send several JSON-RPC requests in one HTTP round-trip
 
-if __name__ == "__main__":
+    If the node rejects the batch as a whole, the requests are retried
+    individually (concurrently) on the same client.
+
+    Returns a dict of request id -> response
+    """
+    response = await client.post(SUI_RPC_URL, json=payloads)
+    results = response.json()
+    if isinstance(results, dict):
+        # Batch not accepted: fall back to one request per payload
+        responses = await asyncio.gather(
+            *(client.post(SUI_RPC_URL, json=payload) for payload in payloads)
+        )
+        return {payload["id"]: r.json() for payload, r in zip(payloads, responses)}
+    return {r.get("id"): r for r in results}
+
+def _cache_key(payload: dict) -> str:
+    """Cache key for a JSON-RPC request: method + canonical params"""
+    return payload["method"] + ":" + json.dumps(payload["params"], sort_keys=True, separators=(",", ":"))
+
+def _is_cacheable(payload: dict, response: dict) -> bool:
+    """
+    Whether a response is a real success worth reusing
+
+    sui_getObject reports a missing/deleted object inside the result
+    ({"result": {"error": ...}}), so for it only a result carrying data counts.
+    """
+    result = response.get("result")
+    if not isinstance(result, dict):
+        return result is not None
+    if "error" in result:
+        return False
+    if payload["method"] == "sui_getObject":
+        return result.get("data") is not None
+    return True
+
+def load_cache() -> dict:
+    """Read the on-disk RPC cache (empty if missing or unreadable)"""
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache: dict):
+    """Write the RPC cache back to disk"""
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+async def cached_rpc_batch(client: httpx.AsyncClient, payloads: list):
+    """
+    rpc_batch() that answers fresh requests from the on-disk cache
+
+    Only cache misses go over the network; successful responses are cached
+    (see _is_cacheable).
+    """
+    cache = load_cache()
+    now = time.time()
+    responses = {}
+    misses = []
+    for payload in payloads:
+        entry = cache.get(_cache_key(payload))
+        if entry and now - entry["ts"] < CACHE_TTL:
+            responses[payload["id"]] = entry["response"]
+        else:
+            misses.append(payload)
+
+    if misses:
+        fetched = await rpc_batch(client, misses)
+        for payload in misses:
+            response = fetched.get(payload["id"])
+            if response is None:
+                continue
+            responses[payload["id"]] = response
+            if _is_cacheable(payload, response):
+                cache[_cache_key(payload)] = {"ts": now, "response": response}
+        save_cache(cache)
+
+    return responses
+
+async def get_package_and_module(client: httpx.AsyncClient, package_id: str, module_name: str):
+    """Get the package object and one of its modules with one batched request"""
+    responses = await cached_rpc_batch(client, [
+        get_object_payload(package_id, 1),
+        get_normalized_module_payload(package_id, module_name, 2)
+    ])
+
+    missing = {"error": "No response for request"}
+    return responses.get(1, missing), responses.get(2, missing)
+
+async def main():
     print("=" * 60)
     print(f"Verifying package: {PACKAGE_ID}")
     print("=" * 60)
 
+    # Both probes go out in a single JSON-RPC batch
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        result, module_result = await get_package_and_module(
+            client, PACKAGE_ID, "address_book"
+        )
+
     # Check if package exists
     print("\n1. Checking if package object exists...")
-    result = get_object(PACKAGE_ID)
 
     if "result" in result:
         data = result["result"].get("data")
@@ -61,7 +162,6 @@ if __name__ == "__main__":
 
     # Check for address_book module
     print("\n2. Checking address_book module...")
-    module_result = get_normalized_module(PACKAGE_ID, "address_book")
 
     if "result" in module_result and module_result["result"]:
         print("   Module 'address_book' exists!")
@@ -74,3 +174,6 @@ if __name__ == "__main__":
     print("CORRECT TARGET SHOULD BE:")
     print(f"{PACKAGE_ID}::address_book::create_address_book")
     print("=" * 60)
+
+if __name__ == "__main__":
+    asyncio.run(main())